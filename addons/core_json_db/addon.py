@@ -14,6 +14,8 @@ log = get_logger(__name__)
 
 
 class JsonFileDbAddon(QiAddonBase):
+    _adapter: JsonFileDbAdapter | None = None
+
     @property
     def name(self) -> str:
         return "core_json_db"
@@ -32,8 +34,14 @@ class JsonFileDbAddon(QiAddonBase):
         data_dir = Path(BASE_PATH) / "data"
         data_dir.mkdir(exist_ok=True)
 
-        adapter = JsonFileDbAdapter(str(data_dir))
-        qi_db_manager.set_file_adapter(adapter)
+        self._adapter = JsonFileDbAdapter(str(data_dir))
+        qi_db_manager.set_file_adapter(self._adapter)
 
     def close(self) -> None:
-        pass
+        """
+        Shuts down the adapter's I/O thread pool. Queued settings saves are
+        flushed by the application before addons are closed.
+        """
+        if self._adapter is not None:
+            self._adapter.close()
+            self._adapter = None
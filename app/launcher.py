@@ -12,6 +12,7 @@ from core.addon.manager import qi_addon_manager
 from core.bundle.manager import qi_bundle_manager
 from core.config import qi_launch_config
 from core.constants import BASE_PATH
+from core.db.manager import qi_db_manager
 from core.gui.window_manager import qi_window_manager
 from core.logger import get_logger
 from core.settings.bus_handlers import register_settings_handlers
@@ -19,6 +20,9 @@ from core.settings.manager import qi_settings_manager
 
 log = get_logger(__name__)
 
+# Seconds shutdown waits for queued settings saves to be written
+_SETTINGS_FLUSH_TIMEOUT = 10.0
+
 
 class QiApplication:
     """
@@ -91,12 +95,8 @@ class QiApplication:
         """
         Creates the main application window.
         """
-        self.main_window_icon = os.path.join(
-            BASE_PATH,
-            "resources",
-            "qi-icons",
-            "qi_512.png",
-        ).replace("\\", "/")
+        # BASE_PATH is already a posix path, so join with "/" directly
+        self.main_window_icon = f"{BASE_PATH}/resources/qi-icons/qi_512.png"
 
         qi_window_manager.create_window(
             addon="addon-skeleton", session_id="main-session"
@@ -134,6 +134,11 @@ class QiApplication:
         Gracefully shuts down all application services.
         """
         log.info("--- Qi Application Shutting Down ---")
+        # Write queued settings saves before the db provider is closed
+        try:
+            qi_db_manager.flush_settings_threadsafe(_SETTINGS_FLUSH_TIMEOUT)
+        except Exception:
+            log.exception("Failed to write queued settings saves on shutdown.")
         qi_addon_manager.close_all()
         log.info("All addons closed.")
         # The server thread is a daemon, so it will exit with the main process.
@@ -135,11 +135,12 @@ def apply_args_to_config(args):
 
 
 if __name__ == "__main__":
-    # Parse arguments
-    args = parse_args()
-
-    # Apply arguments to configuration
-    apply_args_to_config(args)
+    if len(sys.argv) > 1:
+        # Parse arguments and apply them to the configuration
+        apply_args_to_config(parse_args())
+    else:
+        # No arguments, so there is nothing to parse: only set up logging
+        setup_logging(log_level=app_config.log_level)
 
     # Run the application
     sys.exit(main())
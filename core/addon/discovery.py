@@ -5,7 +5,7 @@ This module contains functions for discovering and loading addons.
 """
 
 import importlib.util
-import inspect
+import os
 import sys
 from pathlib import Path
 from typing import Type
@@ -30,20 +30,27 @@ def discover_addon_dirs(addon_paths: list[str]) -> dict[str, Path]:
     """
     discovered = {}
     for path_str in addon_paths:
-        path = Path(path_str)
-        if not path.is_dir():
+        # Directory entries carry their file type, so only the addon.py
+        # check needs a stat per subdirectory
+        try:
+            entries = os.scandir(path_str)
+        except (FileNotFoundError, NotADirectoryError):
             continue
-        for child in path.iterdir():
-            if child.is_dir() and (child / "addon.py").is_file():
-                if child.name in discovered:
+        with entries:
+            for entry in entries:
+                if not entry.is_dir() or not os.path.isfile(
+                    os.path.join(entry.path, "addon.py")
+                ):
+                    continue
+                if entry.name in discovered:
                     # For now, the first one discovered wins.
                     log.warning(
-                        f"Duplicate addon name '{child.name}' found at "
-                        f"'{child.resolve()}'. The existing one at "
-                        f"'{discovered[child.name]}' will be used."
+                        f"Duplicate addon name '{entry.name}' found at "
+                        f"'{Path(entry.path).resolve()}'. The existing one at "
+                        f"'{discovered[entry.name]}' will be used."
                     )
                 else:
-                    discovered[child.name] = child.resolve()
+                    discovered[entry.name] = Path(entry.path).resolve()
     return discovered
 
 
@@ -89,25 +96,37 @@ def load_addon_from_path(addon_name: str, addon_path: Path) -> QiAddonBase:
     except Exception as e:
         raise AddonLoadError(f"Failed to import addon '{addon_name}': {e}") from e
 
-    # Find the QiAddonBase subclass in the loaded module
-    for _, obj in inspect.getmembers(module, inspect.isclass):
-        if issubclass(obj, QiAddonBase) and obj is not QiAddonBase:
-            addon_class: Type[QiAddonBase] = obj
-            try:
-                instance = addon_class()
-                # Basic validation
-                if instance.name != addon_name:
-                    raise AddonLoadError(
-                        f"Addon name mismatch in '{addon_name}': "
-                        f"Directory is '{addon_name}', but class `name` is '{instance.name}'."
-                    )
-                return instance
-            except Exception as e:
-                raise AddonLoadError(
-                    f"Failed to instantiate addon class '{addon_class.__name__}' "
-                    f"in '{addon_name}': {e}"
-                ) from e
-
-    raise AddonLoadError(
-        f"Could not find a QiAddonBase subclass in '{addon_name}/addon.py'."
-    )
+    # Find the QiAddonBase subclass in the loaded module's namespace,
+    # preferring one defined in addon.py itself over imported ones
+    addon_class: Type[QiAddonBase] | None = None
+    for obj in module.__dict__.values():
+        if (
+            isinstance(obj, type)
+            and issubclass(obj, QiAddonBase)
+            and obj is not QiAddonBase
+        ):
+            if obj.__module__ == module_name:
+                addon_class = obj
+                break
+            if addon_class is None:
+                addon_class = obj
+
+    if addon_class is None:
+        raise AddonLoadError(
+            f"Could not find a QiAddonBase subclass in '{addon_name}/addon.py'."
+        )
+
+    try:
+        instance = addon_class()
+        # Basic validation
+        if instance.name != addon_name:
+            raise AddonLoadError(
+                f"Addon name mismatch in '{addon_name}': "
+                f"Directory is '{addon_name}', but class `name` is '{instance.name}'."
+            )
+        return instance
+    except Exception as e:
+        raise AddonLoadError(
+            f"Failed to instantiate addon class '{addon_class.__name__}' "
+            f"in '{addon_name}': {e}"
+        ) from e
@@ -5,7 +5,10 @@ This module contains the manager for all Qi addons.
 """
 
 from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Final, Optional
 
 from core.addon.base import (
@@ -19,6 +22,17 @@ from core.logger import get_logger
 
 log = get_logger(__name__)
 
+# Most addon modules imported at the same time during Phase 1
+_MAX_LOAD_WORKERS: Final[int] = 8
+
+
+def _try_load_addon(name: str, path: Path) -> QiAddonBase | Exception:
+    """Load an addon, returning the exception instead of raising it."""
+    try:
+        return load_addon_from_path(name, path)
+    except Exception as e:
+        return e
+
 
 class QiAddonManager:
     """
@@ -60,18 +74,30 @@ class QiAddonManager:
 
         addons_by_role = defaultdict(list)
 
-        for name, path in self._discovered_addons.items():
-            try:
-                addon = load_addon_from_path(name, path)
-                self._loaded_addons[addon.name] = addon
-                if addon.role in ("auth", "db"):
-                    addons_by_role[addon.role].append(addon)
-                else:
-                    self._pending_registration.append(addon)
-            except Exception as e:
-                log.error(f"Failed to load addon '{name}': {e}")
-                self._failed_addons[name] = e
+        # Import and instantiate addons concurrently, their modules don't
+        # depend on each other. Results are handled in discovery order.
+        names = list(self._discovered_addons)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(_MAX_LOAD_WORKERS, len(names))),
+            thread_name_prefix="qi-addon-load",
+        ) as pool:
+            results = list(
+                pool.map(_try_load_addon, names, self._discovered_addons.values())
+            )
+
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                log.error(f"Failed to load addon '{name}': {result}")
+                self._failed_addons[name] = result
                 # Don't raise here - continue loading other addons
+                continue
+
+            addon = result
+            self._loaded_addons[addon.name] = addon
+            if addon.role in ("auth", "db"):
+                addons_by_role[addon.role].append(addon)
+            else:
+                self._pending_registration.append(addon)
 
         # Validate and register core providers
         for role in ("auth", "db"):
@@ -116,7 +142,7 @@ class QiAddonManager:
 
         for addon in self._pending_registration:
             try:
-                log.debug(f"Registering regular addon: '{addon.name}'")
+                log.debug("Registering regular addon: '%s'", addon.name)
                 addon.discover()
                 addon.register()
                 log.info(f"Registered regular addon: '{addon.name}'")
@@ -135,7 +161,9 @@ class QiAddonManager:
         for role, provider in self._providers.items():
             try:
                 provider.install()
-                log.debug(f"Ran install hook for '{role}' provider: '{provider.name}'")
+                log.debug(
+                    "Ran install hook for '%s' provider: '%s'", role, provider.name
+                )
             except Exception as e:
                 log.error(
                     f"Error in install hook for '{role}' provider '{provider.name}': {e}"
@@ -146,7 +174,7 @@ class QiAddonManager:
         for addon in successful_addons:
             try:
                 addon.install()
-                log.debug(f"Ran install hook for addon: '{addon.name}'")
+                log.debug("Ran install hook for addon: '%s'", addon.name)
             except Exception as e:
                 log.error(f"Error in install hook for addon '{addon.name}': {e}")
                 self._addons_with_errors[addon.name] = e
@@ -166,13 +194,13 @@ class QiAddonManager:
         """Returns a list of all loaded addon instances."""
         return list(self._loaded_addons.values())
 
-    def get_failed_addons(self) -> dict[str, Exception]:
-        """Returns a dictionary of addons that failed to load with their exceptions."""
-        return self._failed_addons.copy()
+    def get_failed_addons(self) -> Mapping[str, Exception]:
+        """Returns a read-only view of addons that failed to load with their exceptions."""
+        return MappingProxyType(self._failed_addons)
 
-    def get_addons_with_errors(self) -> dict[str, Exception]:
-        """Returns a dictionary of addons that had non-fatal errors during registration or installation."""
-        return self._addons_with_errors.copy()
+    def get_addons_with_errors(self) -> Mapping[str, Exception]:
+        """Returns a read-only view of addons that had non-fatal errors during registration or installation."""
+        return MappingProxyType(self._addons_with_errors)
 
     def is_provider_available(self, role: AddonRole) -> bool:
         """Checks if a provider with the specified role is available."""
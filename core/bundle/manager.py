@@ -62,13 +62,8 @@ class QiBundleManager:
                         f"Bundle key must match bundle name. Skipping this bundle."
                     )
                     continue
-                try:
-                    # Validate each bundle individually
-                    self._bundles[bundle_key] = QiBundle.model_validate(bundle_data)
-                except ValidationError as e:
-                    log.error(
-                        f"Skipping invalid bundle '{bundle_key}' in '{bundles_file}': {e}"
-                    )
+                # Already a validated QiBundle, parsed along with the collection
+                self._bundles[bundle_key] = bundle_data
 
             if not self._bundles:
                 # If the file exists and was parsed but no valid bundles were found,
@@ -5,7 +5,9 @@ This module contains the configuration for the Qi system.
 """
 
 import os
+import re
 import tomllib
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Final, Self, Type
 
@@ -27,6 +29,60 @@ from core.constants import (
     DOTENV_FILE,
 )
 
+# Splits os.pathsep-separated path lists, collapsing repeated separators
+_PATHSEP_PATTERN: Final[re.Pattern[str]] = re.compile(f"{re.escape(os.pathsep)}+")
+
+# Fallbacks for path fields that are given an empty value
+_DEFAULT_PATHS: Final[dict[str, str]] = {
+    "base_path": BASE_PATH,
+    "bundles_file": BUNDLES_FILE,
+}
+
+
+@lru_cache(maxsize=256)
+def _resolve_strict_path(path: str) -> str:
+    """
+    Resolve a path string that must exist, memoized per process.
+    Raising calls are not cached, so missing paths are checked again next time.
+    """
+    return Path(path).resolve(strict=True).as_posix()
+
+
+def _resolve_path(path: str) -> str:
+    """
+    Resolve a path string to an absolute posix path.
+    Only existing paths are memoized, keyed by their absolute path.
+    """
+    try:
+        return _resolve_strict_path(Path(path).absolute().as_posix())
+    except (FileNotFoundError, RuntimeError):
+        return Path(path).resolve().as_posix()
+
+
+def _resolve_existing_path(path: str) -> str:
+    """
+    Resolve an absolute path string, following symlinks only if it exists.
+    If resolving fails, the absolute path is returned as-is.
+    """
+    try:
+        return _resolve_strict_path(path)
+    except (FileNotFoundError, RuntimeError):
+        return Path(path).absolute().as_posix()
+
+
+@lru_cache(maxsize=8)
+def _load_toml_config(config_file: str) -> dict[str, Any]:
+    """
+    Read the [qi] table of a TOML config file, cached per process.
+    Returns an empty dict if the file doesn't exist. Read and parse errors
+    are not cached. Use `_load_toml_config.cache_clear()` to force a re-read.
+    """
+    config_path = Path(config_file)
+    if not config_path.exists():
+        return {}
+    with open(config_path, "rb") as f:
+        return tomllib.load(f).get("qi", {})
+
 
 class QiLaunchConfig(BaseSettings):
     """
@@ -57,18 +113,15 @@ class QiLaunchConfig(BaseSettings):
         file_secret_settings: PydanticBaseSettingsSource,
     ) -> tuple[PydanticBaseSettingsSource, ...]:
         toml_data: dict[str, Any] = {}
-        config_path = Path(CONFIG_FILE)
-        if config_path.exists():
-            try:
-                with open(config_path, "rb") as f:
-                    toml_data = tomllib.load(f).get("qi", {})
-            except tomllib.TOMLDecodeError as e:
-                raise SettingsError(f"Error parsing TOML file: {e}")
-            except OSError as e:
-                # Using print because logger is not available here to avoid circular import.
-                print(
-                    f"WARNING: Could not read config file at '{config_path}': {e}. Proceeding with defaults."
-                )
+        try:
+            toml_data = _load_toml_config(CONFIG_FILE)
+        except tomllib.TOMLDecodeError as e:
+            raise SettingsError(f"Error parsing TOML file: {e}")
+        except OSError as e:
+            # Using print because logger is not available here to avoid circular import.
+            print(
+                f"WARNING: Could not read config file at '{CONFIG_FILE}': {e}. Proceeding with defaults."
+            )
 
         # Values from TOML file should override constructor arguments.
         # We start with constructor args and then update with TOML data.
@@ -122,6 +175,12 @@ class QiLaunchConfig(BaseSettings):
     # Pending requests per session
     max_pending_requests_per_session: int = Field(default=100)
 
+    # Seconds that read-only db handler results are cached for
+    db_cache_ttl: float = Field(default=2.0)
+
+    # Seconds queued settings saves wait for more saves before being written
+    settings_save_delay: float = Field(default=0.1)
+
     @field_validator("addon_paths", mode="before")
     @classmethod
     def _parse_addon_paths(cls, v: str | list[str]) -> list[str]:
@@ -130,19 +189,16 @@ class QiLaunchConfig(BaseSettings):
         Filters out empty or whitespace-only path strings before resolving.
         """
         if isinstance(v, str):
-            paths_str = v.split(os.pathsep)
+            paths_str = _PATHSEP_PATTERN.split(v)
         elif isinstance(v, list):
             paths_str = v
         else:  # Should not happen with type hints, but good for robustness
             return []
 
-        resolved_paths = []
-        for p_str in paths_str:
-            if (
-                p_str and p_str.strip()
-            ):  # Check if string is not empty and not just whitespace
-                resolved_paths.append(Path(p_str.strip()).resolve().as_posix())
-        return resolved_paths
+        # Skip empty or whitespace-only entries, stripping each entry only once
+        return [
+            _resolve_path(p) for p_str in paths_str if p_str and (p := p_str.strip())
+        ]
 
     @field_validator("log_level", mode="before")
     @classmethod
@@ -161,8 +217,11 @@ class QiLaunchConfig(BaseSettings):
         Relative paths are resolved from the project's BASE_PATH.
         """
         if not v:
-            default_map = {"base_path": BASE_PATH, "bundles_file": BUNDLES_FILE}
-            v = default_map.get(info.field_name, "")
+            v = _DEFAULT_PATHS.get(info.field_name, "")
+
+        # The defaults are already absolute posix paths built from the module path
+        if v == BASE_PATH or v == BUNDLES_FILE:
+            return v
 
         path_obj = Path(v)
 
@@ -170,12 +229,7 @@ class QiLaunchConfig(BaseSettings):
         if not path_obj.is_absolute():
             path_obj = Path(BASE_PATH) / path_obj
 
-        try:
-            # First, attempt to get a fully resolved, existing path
-            return path_obj.resolve(strict=True).as_posix()
-        except (FileNotFoundError, RuntimeError):
-            # If resolve fails, fall back to the absolute path without checking existence
-            return path_obj.absolute().as_posix()
+        return _resolve_existing_path(path_obj.as_posix())
 
     @model_validator(mode="after")
     def _dev_mode_setup(self) -> Self:
@@ -9,18 +9,21 @@ from typing import Final
 
 # ______________________ BASE ______________________
 
-BASE_PATH: str = Path(
-    *Path(__file__).resolve().parts[0 : Path(__file__).resolve().parts.index("Qi") + 1]
-).as_posix()
+# Keep resolve(): a symlinked checkout would otherwise hide the "Qi" component
+_FILE_PARTS: tuple[str, ...] = Path(__file__).resolve().parts
 
-CONFIG_FILE: str = Path(Path(BASE_PATH) / "config" / "qi.config.toml").as_posix()
+BASE_PATH: str = Path(*_FILE_PARTS[: _FILE_PARTS.index("Qi") + 1]).as_posix()
 
-DOTENV_FILE: str = Path(Path(BASE_PATH) / "config" / ".env").as_posix()
+_CONFIG_DIR: Path = Path(BASE_PATH) / "config"
+
+CONFIG_FILE: str = (_CONFIG_DIR / "qi.config.toml").as_posix()
+
+DOTENV_FILE: str = (_CONFIG_DIR / ".env").as_posix()
 
 
 # ______________________ BUNDLES ______________________
 
-BUNDLES_FILE: str = Path(Path(BASE_PATH) / "config" / "bundles.toml").as_posix()
+BUNDLES_FILE: str = (_CONFIG_DIR / "bundles.toml").as_posix()
 
 DEFAULT_BUNDLE_NAME: Final[str] = "production"
 
@@ -4,20 +4,231 @@
 This module contains the message handlers for the database service.
 """
 
-from typing import Any
+from __future__ import annotations
 
+import asyncio
+import functools
+import hmac
+import secrets
+import time
+from array import array
+from collections.abc import Awaitable, Callable, Mapping
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, TypeVar, final
+
+from core.config import qi_launch_config
 from core.constants import HUB_ID
-from core.db.adapters import AuthenticationError
-from core.db.manager import qi_db_manager
+from core.db.adapters import AuthenticationError, DbAdapterError, StorageError
+from core.lib.utils import QiTTLCache
 from core.logger import get_logger
 from core.messaging.hub import qi_hub
+from core.models import QiMessage
+
+if TYPE_CHECKING:
+    # Imported lazily by register_db_handlers, so importing this module
+    # doesn't build the db manager
+    from core.db.manager import QiDbManager
 
 log = get_logger(__name__)
 
+_Handler = TypeVar("_Handler", bound=Callable[..., Awaitable[Any]])
+
+# Topic → name of the _DbHandlerService method that handles it
+_DB_HANDLER_TOPICS: Final[tuple[tuple[str, str], ...]] = (
+    # Authentication handlers
+    ("auth.login", "handle_auth_login"),
+    ("auth.validate", "handle_auth_validate"),
+    ("auth.logout", "handle_auth_logout"),
+    # Project handlers
+    ("db_service.project.list", "handle_db_project_list"),
+    # Composite handlers
+    ("db_service.bootstrap", "handle_db_bootstrap"),
+    # Diagnostics
+    ("db_service.stats", "handle_db_stats"),
+)
+
+# Per-handler call counts and total latency, indexed like _DB_HANDLER_TOPICS.
+# Only touched from the event loop, so plain in-place adds need no lock.
+_handler_calls: Final[array] = array("Q", [0] * len(_DB_HANDLER_TOPICS))
+_handler_latency_ns: Final[array] = array("Q", [0] * len(_DB_HANDLER_TOPICS))
+_handler_rejections: Final[array] = array("Q", [0] * len(_DB_HANDLER_TOPICS))
+
+# Message and payload keys read by the handlers. The literals are already
+# interned by the compiler, so every handler looks up the same key objects.
+_PAYLOAD: Final[str] = "payload"
+_TOKEN: Final[str] = "token"
+_USERNAME: Final[str] = "username"
+_PASSWORD: Final[str] = "password"
+
+# Read-only payload for messages that arrive without one
+_EMPTY_PAYLOAD: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Shared read-only reply for handlers that only report success
+_SUCCESS: Final[Mapping[str, Any]] = MappingProxyType({"success": True})
+
+# Calls a handler runs at once, and calls it lets wait for a slot, before
+# further calls are turned away with the busy reply
+_MAX_IN_FLIGHT: Final[int] = 32
+_MAX_WAITING: Final[int] = 64
+_BUSY: Final[Mapping[str, Any]] = MappingProxyType(
+    {"error": "busy", "retry_after": 0.5}
+)
+
+# How long a successful login is reused, and logins for a user with a failed
+# attempt are rejected without asking the auth adapter again
+_LOGIN_CACHE_TTL: Final[float] = 5.0
+_FAILED_LOGIN_TTL: Final[float] = 1.0
+
+# Process-scoped key for hashing credentials into login cache keys, so the
+# cache never holds a username/password pair
+_LOGIN_CACHE_SECRET: Final[bytes] = secrets.token_bytes(32)
+
+# Extracts (username, password) from an auth.login payload
+_get_credentials: Final[itemgetter] = itemgetter(_USERNAME, _PASSWORD)
+
+
+# Attempts and initial backoff for handlers failing with a transient StorageError
+_RETRY_ATTEMPTS: Final[int] = 3
+_RETRY_BACKOFF: Final[float] = 0.1
+
+
+def _retried(index: int, handler: _Handler) -> _Handler:
+    """
+    Wrap a db handler so transient storage errors are retried with backoff.
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        delay = _RETRY_BACKOFF
+        for _ in range(_RETRY_ATTEMPTS - 1):
+            try:
+                return await handler(*args, **kwargs)
+            except StorageError as e:
+                log.warning(
+                    f"Retrying '{_DB_HANDLER_TOPICS[index][0]}' in {delay}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+        return await handler(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _logged(index: int, handler: _Handler) -> _Handler:
+    """
+    Wrap a db handler so adapter errors are logged before propagating.
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await handler(*args, **kwargs)
+        except DbAdapterError as e:
+            log.error(f"Error handling '{_DB_HANDLER_TOPICS[index][0]}': {e}")
+            raise
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _with_payload(index: int, handler: _Handler) -> _Handler:
+    """
+    Wrap a db handler so it always receives a mapping with a payload, whether
+    the bus delivered a QiMessage or a plain dict without one. Handlers can
+    then read message["payload"] directly.
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(message: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(message, QiMessage):
+            message = {_PAYLOAD: message.payload}
+        elif message.get(_PAYLOAD) is None:
+            message = {**message, _PAYLOAD: _EMPTY_PAYLOAD}
+        return await handler(message, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _bounded(index: int, handler: _Handler) -> _Handler:
+    """
+    Wrap a db handler so a stalled adapter can't queue calls without bound.
+    Once _MAX_WAITING calls are waiting for one of the _MAX_IN_FLIGHT slots,
+    further calls get the busy reply and are counted as rejections.
+    """
+    semaphore = asyncio.Semaphore(_MAX_IN_FLIGHT)
+    waiting = 0
+
+    @functools.wraps(handler)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal waiting
+        if semaphore.locked() and waiting >= _MAX_WAITING:
+            _handler_rejections[index] += 1
+            return _BUSY
+
+        waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            waiting -= 1
+
+        try:
+            return await handler(*args, **kwargs)
+        finally:
+            semaphore.release()
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _metered(index: int, handler: _Handler) -> _Handler:
+    """
+    Wrap a db handler so its calls and latency are counted at index.
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter_ns()
+        try:
+            return await handler(*args, **kwargs)
+        finally:
+            _handler_calls[index] += 1
+            _handler_latency_ns[index] += time.perf_counter_ns() - started
+
+    return wrapper  # type: ignore[return-value]
+
 
+# Behaviors wrapped around every registered db handler, outermost first.
+# Each takes the handler's index in _DB_HANDLER_TOPICS and the handler.
+_DB_HANDLER_PIPELINE: Final[tuple[Callable[[int, _Handler], _Handler], ...]] = (
+    _with_payload,
+    _metered,
+    _bounded,
+    _logged,
+    _retried,
+)
+
+
+@final
 class _DbHandlerService:
-    def __init__(self):
-        self.db_manager = qi_db_manager
+    __slots__ = (
+        "_failed_login_cache",
+        "_login_cache",
+        "_projects_cache",
+        "_validate_cache",
+        "db_manager",
+    )
+
+    def __init__(self, db_manager: QiDbManager) -> None:
+        self.db_manager: QiDbManager = db_manager
+        # Project lists and token validations keyed by auth token,
+        # dropped on login/logout
+        self._projects_cache: QiTTLCache = QiTTLCache(ttl=qi_launch_config.db_cache_ttl)
+        self._validate_cache: QiTTLCache = QiTTLCache(ttl=qi_launch_config.db_cache_ttl)
+        # Login results keyed by a credentials digest, to absorb re-logins
+        # from reconnecting clients
+        self._login_cache: QiTTLCache = QiTTLCache(ttl=_LOGIN_CACHE_TTL)
+        # Failed logins keyed by a username digest, so guessing a different
+        # password each time still hits the window
+        self._failed_login_cache: QiTTLCache = QiTTLCache(ttl=_FAILED_LOGIN_TTL)
 
     async def handle_auth_login(self, message: dict[str, Any]) -> dict[str, Any]:
         """
@@ -31,20 +242,39 @@ class _DbHandlerService:
         Returns:
             User information and token
         """
-        payload = message.get("payload", {})
-        username = payload.get("username")
-        password = payload.get("password")
+        username: str | None
+        password: str | None
+        try:
+            username, password = _get_credentials(message[_PAYLOAD])
+        except KeyError:
+            username = password = None
 
         if not username or not password:
-            log.warning("Login attempt with missing credentials")
             raise AuthenticationError("Username and password are required")
 
+        username_key = _credentials_digest(username)
+        if self._failed_login_cache.get(username_key) is not None:
+            raise AuthenticationError("Invalid credentials")
+
+        # Reuse a recent login as long as its token is still the current one
+        credentials_key = _credentials_digest(username, password)
+        result: dict[str, Any] | None = self._login_cache.get(credentials_key)
+        if result is not None and (
+            result.get("token") == self.db_manager.get_current_token()
+        ):
+            return result
+
+        self._projects_cache.invalidate()
+        self._validate_cache.invalidate()
         try:
-            return await self.db_manager.login(username, password)
-        except Exception as e:
-            log.error(f"Error during login: {e}")
+            result = await self.db_manager.login(username, password)
+        except AuthenticationError:
+            self._failed_login_cache.set(username_key, True)
             raise
 
+        self._login_cache.set(credentials_key, result)
+        return result
+
     async def handle_auth_validate(self, message: dict[str, Any]) -> dict[str, Any]:
         """
         Handle auth.validate messages.
@@ -56,16 +286,20 @@ class _DbHandlerService:
         Returns:
             User information if token is valid
         """
-        payload = message.get("payload", {})
-        token = payload.get("token")
+        token: str | None = message[_PAYLOAD].get(_TOKEN)
 
-        try:
-            return await self.db_manager.validate_token(token)
-        except Exception as e:
-            log.error(f"Error validating token: {e}")
-            raise
+        # Recently validated tokens skip the adapter round-trip
+        cache_key: str | None = token or self.db_manager.get_current_token()
+        result: dict[str, Any] | None = self._validate_cache.get(cache_key)
+        if result is not None:
+            return result
+
+        result = await self.db_manager.validate_token(token)
+        if cache_key is not None:
+            self._validate_cache.set(cache_key, result)
+        return result
 
-    async def handle_auth_logout(self, message: dict[str, Any]) -> dict[str, Any]:
+    async def handle_auth_logout(self, message: dict[str, Any]) -> Mapping[str, Any]:
         """
         Handle auth.logout messages.
 
@@ -76,7 +310,10 @@ class _DbHandlerService:
             Success status
         """
         self.db_manager.logout()
-        return {"success": True}
+        self._projects_cache.invalidate()
+        self._validate_cache.invalidate()
+        self._login_cache.invalidate()
+        return _SUCCESS
 
     async def handle_db_project_list(
         self, message: dict[str, Any]
@@ -90,30 +327,103 @@ class _DbHandlerService:
         Returns:
             list of project dictionaries
         """
-        try:
-            return await self.db_manager.list_projects()
-        except Exception as e:
-            log.error(f"Error listing projects: {e}")
-            raise
+        token: str | None = self.db_manager.get_current_token()
+        projects: list[dict[str, Any]] | None = self._projects_cache.get(token)
+        if projects is not None:
+            return projects
+
+        projects = await self.db_manager.list_projects()
+        self._projects_cache.set(token, projects)
+        return projects
+
+    async def handle_db_bootstrap(self, message: dict[str, Any]) -> dict[str, Any]:
+        """
+        Handle db_service.bootstrap messages, running the independent reads
+        a client needs on startup concurrently instead of one message each.
 
+        Args:
+            message: The message payload containing:
+                - token: Optional token to validate (uses current if not provided)
 
-def register_db_handlers() -> None:
+        Returns:
+            A dict with "user" and "projects" entries. A read that failed is
+            reported as {"error": <message>} in its entry.
+        """
+        user, projects = await asyncio.gather(
+            self.handle_auth_validate(message),
+            self.handle_db_project_list(message),
+            return_exceptions=True,
+        )
+        return {
+            "user": _result_or_error(user),
+            "projects": _result_or_error(projects),
+        }
+
+    async def handle_db_stats(self, message: dict[str, Any]) -> dict[str, Any]:
+        """
+        Handle db_service.stats messages.
+
+        Args:
+            message: The message payload (unused)
+
+        Returns:
+            Call count, latency in milliseconds and busy rejections for each
+            db handler topic
+        """
+        stats: dict[str, Any] = {}
+        for index, (topic, _) in enumerate(_DB_HANDLER_TOPICS):
+            calls = _handler_calls[index]
+            total_ms = _handler_latency_ns[index] / 1_000_000
+            stats[topic] = {
+                "calls": calls,
+                "total_ms": total_ms,
+                "avg_ms": total_ms / calls if calls else 0.0,
+                "rejected": _handler_rejections[index],
+            }
+        return stats
+
+
+def _credentials_digest(*credentials: str) -> bytes:
+    """
+    Key the login caches by a keyed hash of the given credentials.
+    """
+    joined = "\0".join(credentials).encode()
+    return hmac.digest(_LOGIN_CACHE_SECRET, joined, "sha256")[:16]
+
+
+def _result_or_error(result: Any) -> Any:
+    """
+    Replace an exception returned by asyncio.gather with an error marker.
+    """
+    if isinstance(result, BaseException):
+        return {"error": str(result)}
+    return result
+
+
+def register_db_handlers(db_manager: QiDbManager | None = None) -> None:
     """
     Register all database-related handlers with the message bus.
+
+    Args:
+        db_manager: The manager the handlers delegate to, bound once here.
+                    Defaults to the qi_db_manager singleton.
     """
-    handler_service = _DbHandlerService()
+    if db_manager is None:
+        from core.db.manager import qi_db_manager
 
-    # Authentication handlers
-    qi_hub.on("auth.login", handler_service.handle_auth_login, session_id=HUB_ID)
-    qi_hub.on("auth.validate", handler_service.handle_auth_validate, session_id=HUB_ID)
-    qi_hub.on("auth.logout", handler_service.handle_auth_logout, session_id=HUB_ID)
+        db_manager = qi_db_manager
 
-    # Project handlers
-    qi_hub.on(
-        "db_service.project.list",
-        handler_service.handle_db_project_list,
-        session_id=HUB_ID,
-    )
+    handler_service = _DbHandlerService(db_manager)
+
+    # Bind the loop invariants once instead of resolving them per topic
+    on, hub_id = qi_hub.on, HUB_ID
+    pipeline = tuple(reversed(_DB_HANDLER_PIPELINE))
+
+    for index, (topic, method_name) in enumerate(_DB_HANDLER_TOPICS):
+        handler = getattr(handler_service, method_name)
+        for behavior in pipeline:
+            handler = behavior(index, handler)
+        on(topic, session_id=hub_id)(handler)
 
     # NOTE: Settings and Bundle handlers are intentionally removed.
     # All settings and bundle operations should go through the high-level
@@ -124,9 +434,7 @@ def register_db_handlers() -> None:
     # settings model rebuilds).
 
     # Low-level data handlers
-    # (These might be added in the future if direct data access is needed)
-    # qi_hub.on("db_service.data.get", handle_db_data_get, session_id=HUB_ID)
-    # qi_hub.on("db_service.data.save", handle_db_data_save, session_id=HUB_ID)
-    # qi_hub.on("db_service.data.delete", handle_db_data_delete, session_id=HUB_ID)
+    # (These might be added to _DB_HANDLER_TOPICS in the future if direct
+    # data access is needed, e.g. "db_service.data.get")
 
     log.info("Database message handlers registered")
@@ -8,16 +8,267 @@ This adapter stores data in JSON files on the local filesystem.
 
 import asyncio
 import json
+import mmap
 import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Final, Iterator, NamedTuple, TypeVar
+from weakref import WeakValueDictionary
 
+from core.config import qi_launch_config
 from core.db.adapters import QiFileDbAdapter, StorageError
 from core.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
 log = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Valid settings scopes, each stored in its own file under settings/
+_SETTINGS_SCOPES: Final[frozenset[str]] = frozenset({"bundle", "project", "user"})
+
+# Key of the file holding bundle definitions and the active bundle name
+_BUNDLES_KEY: Final[str] = "bundles/bundles.json"
+
+# Seconds the bundle methods reuse their snapshot of the bundles file
+_BUNDLES_SNAPSHOT_TTL: Final[float] = 1.0
+
+# Flags for opening temp files for writing, binary on Windows
+_WRITE_FLAGS: Final[int] = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+)
+
+# Files larger than this many bytes don't keep their raw bytes cached
+_MAX_CACHED_RAW_SIZE: Final[int] = 1024 * 1024
+
+# Largest file, in bytes, read on the event loop by adapters with sync_reads
+_INLINE_READ_SIZE: Final[int] = 64 * 1024
+
+# Returned by _read_blocking when the file matches the cached fingerprint
+_UNCHANGED: Final = object()
+
+# Returned by _read_blocking when the file is larger than its max_size
+_TOO_LARGE: Final = object()
+
+
+def _json_loads(raw: bytes) -> Any:
+    """
+    Decode JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(value: Any, pretty: bool = False) -> bytes:
+    """
+    Encode a value as compact JSON bytes, or indented ones if pretty is set,
+    using orjson when it is installed. Non-string keys are turned into
+    strings, as the stdlib json module does.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, option=option)
+    if pretty:
+        return json.dumps(value, indent=2).encode("utf-8")
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """
+    Stat a path, returning None instead of raising if it doesn't exist.
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _walk_json_files(root: Path) -> Iterator[str]:
+    """
+    Yield the paths of all .json files under root.
+
+    Uses os.scandir so file types come from the directory entries instead of
+    a stat per file. Symlinked directories are not followed. Subdirectories
+    removed during the walk are skipped. If root is missing or is not a
+    directory, FileNotFoundError or NotADirectoryError is raised.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            if directory is root:
+                raise
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    yield entry.path
+
+
+def _fingerprint(st: os.stat_result | None) -> tuple[int, int, int] | None:
+    """
+    Identify a file version by its nanosecond mtime, size and inode, or None
+    if the file doesn't exist. A rewrite within the mtime granularity still
+    changes the size or, for atomic replaces, the inode.
+    """
+    if st is None:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _read_blocking(
+    path: Path,
+    known_fingerprint: tuple[int, int, int] | None,
+    max_size: int | None = None,
+) -> tuple[os.stat_result | None, bytes | None, Any]:
+    """
+    Stat and, if it changed, read and decode a JSON file in one worker hop.
+
+    Returns the stat result (None if the file doesn't exist), the raw file
+    bytes and the decoded data. The data is _UNCHANGED, and nothing is read,
+    if the file's fingerprint still equals known_fingerprint. It is
+    _TOO_LARGE, and nothing is read, if the file is larger than max_size.
+
+    Files too large to have their bytes cached are decoded straight from a
+    memory map when orjson is available, and no raw bytes are returned.
+    """
+    st = _stat_or_none(path)
+    if st is None:
+        return None, None, None
+    if _fingerprint(st) == known_fingerprint:
+        return st, None, _UNCHANGED
+    if max_size is not None and st.st_size > max_size:
+        return st, None, _TOO_LARGE
+    with open(path, "rb") as f:
+        if orjson is not None and st.st_size > _MAX_CACHED_RAW_SIZE:
+            with (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                return st, None, orjson.loads(view)
+        raw = f.read()
+    return st, raw, _json_loads(raw)
+
+
+def _write_blocking(
+    path: Path, value: Any, pretty: bool = False
+) -> tuple[os.stat_result, bytes]:
+    """
+    Encode and atomically write a JSON file, returning the stat result of
+    the written file and the bytes written. The data is fsync'ed before the
+    rename so a crash can't leave a truncated file behind.
+    """
+    return _write_encoded_blocking(path, _json_dumps(value, pretty))
+
+
+def _write_encoded_blocking(path: Path, raw: bytes) -> tuple[os.stat_result, bytes]:
+    """
+    Atomically write already encoded JSON to a file. See _write_blocking.
+    """
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    try:
+        fd = os.open(temp_path, _WRITE_FLAGS, 0o666)
+    except FileNotFoundError:
+        # Only create the parent directories when they are actually missing
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(temp_path, _WRITE_FLAGS, 0o666)
+    try:
+        with open(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+            # The rename keeps mtime, size and inode, so the temp file's stat
+            # is the written file's
+            st = os.fstat(f.fileno())
+        os.replace(temp_path, path)
+    except OSError:
+        # Don't leave a partial temp file behind, e.g. when the disk is full
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return st, raw
+
+
+def _fsync_dir(path: Path) -> None:
+    """
+    Persist renames in a directory. Not supported on every platform, where
+    it is skipped.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_batch_blocking(
+    items: list[tuple[Path, Any, tuple[bytes, tuple[int, int, int]] | None]],
+    pretty: bool = False,
+) -> list[tuple[os.stat_result, bytes] | Exception]:
+    """
+    Write a batch of JSON files in one worker hop, then sync each written
+    file's parent directory once for the whole batch.
+
+    Each item carries the cached (bytes, fingerprint) of its file, if known.
+    A value that encodes to the cached bytes, for a file whose fingerprint
+    still matches, is not written again.
+
+    Returns, per item, the result of _write_blocking or the exception that
+    the item's write raised, so one bad item doesn't fail the others.
+    """
+    results: list[tuple[os.stat_result, bytes] | Exception] = []
+    written_dirs: set[Path] = set()
+    for path, value, known in items:
+        try:
+            raw = _json_dumps(value, pretty)
+            if known is not None and raw == known[0]:
+                st = _stat_or_none(path)
+                if _fingerprint(st) == known[1]:
+                    results.append((st, raw))
+                    continue
+            results.append(_write_encoded_blocking(path, raw))
+            written_dirs.add(path.parent)
+        except Exception as e:
+            results.append(e)
+    for directory in written_dirs:
+        _fsync_dir(directory)
+    return results
+
+
+class _CacheEntry(NamedTuple):
+    """
+    A cached file. The fingerprint is the file's (st_mtime_ns, st_size,
+    st_ino), or None for a negative entry recording that the file doesn't
+    exist. The load time is the monotonic time the entry was last
+    loaded or revalidated.
+    """
+
+    data: Any
+    raw: bytes | None  # encoded file content for get_bytes(), None if large
+    fingerprint: tuple[int, int, int] | None
+    load_time: float
+
 
 class JsonFileDbAdapter(QiFileDbAdapter):
     """
@@ -26,91 +277,237 @@ class JsonFileDbAdapter(QiFileDbAdapter):
     This adapter stores data in JSON files in a specified data directory.
     It organizes data by type (settings, etc.) and scope.
     It is designed to be async-safe and performant by offloading file I/O
-    to a thread pool and using per-file locks to prevent race conditions.
+    to its own bounded thread pool and using per-file locks to prevent
+    race conditions.
     """
 
-    def __init__(self, data_dir: str):
+    def __init__(
+        self,
+        data_dir: str,
+        pool_size: int = 4,
+        max_cache_entries: int = 512,
+        pretty: bool = False,
+        sync_reads: bool = False,
+    ):
         """
         Initialize the adapter with a data directory.
 
         Args:
             data_dir: Path to the directory where data files will be stored
+            pool_size: Number of worker threads reused for file I/O
+            max_cache_entries: Number of keys kept in the cache before the
+                least recently used ones are evicted
+            pretty: Write indented JSON, for files meant to be edited by hand
+            sync_reads: Read small files directly on the event loop, which
+                is faster than a worker hop for files of a few KB. Only use
+                it for local disks, a slow read blocks the whole loop.
         """
         self._data_dir = Path(data_dir).resolve()
+        self._pretty = pretty
+        self._sync_reads = sync_reads
         self._settings_dir = self._data_dir / "settings"
 
         # Ensure directories exist
         self._settings_dir.mkdir(parents=True, exist_ok=True)
 
+        # Storage keys of the settings files, the scopes are fixed
+        self._scope_keys: dict[str, str] = {
+            scope: f"settings/{scope}.json" for scope in _SETTINGS_SCOPES
+        }
+
+        # Paths of the fixed, frequently used keys, built once
+        self._fixed_paths: dict[str, Path] = {
+            key: self._data_dir / key
+            for key in (*self._scope_keys.values(), _BUNDLES_KEY)
+        }
+
         # Cache for loaded data with timestamps
-        self._cache: dict[str, dict[str, Any]] = {}
-        # Cache entry format: {key: {"data": data, "mtime": float, "load_time": float}}
-        # "mtime" is the file's modification time (from os.path.getmtime)
-        # "load_time" is the monotonic time the cache entry was created (from time.monotonic())
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._max_cache_entries = max_cache_entries
         self._cache_ttl = 5.0  # seconds
-
-        # Per-file locks to prevent race conditions on file read/writes
-        self._file_locks: dict[Path, asyncio.Lock] = {}
-        self._master_lock = asyncio.Lock()  # To protect access to _file_locks
+        self._negative_ttl = 2.0  # seconds, for negative entries
+
+        # (load_time, data) of the bundles file, shared by the bundle methods
+        self._bundles_snapshot: tuple[float, dict[str, Any]] | None = None
+
+        # Per-file locks to prevent race conditions on file read/writes.
+        # Weakly held, a lock lives only while a coroutine holds or awaits it,
+        # so the table doesn't grow with every key ever used.
+        self._file_locks: WeakValueDictionary[Path, asyncio.Lock] = (
+            WeakValueDictionary()
+        )
+
+        # Loads in progress, shared by concurrent get() calls on the same key.
+        # The generation is bumped by invalidate_cache() to detach them.
+        self._cache_generation = 0
+        self._inflight: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
+
+        # Writes waiting for the next batch, and the task writing batches
+        self._pending_writes: list[
+            tuple[
+                Path,
+                Any,
+                tuple[bytes, tuple[int, int, int]] | None,
+                asyncio.Future[Any],
+            ]
+        ] = []
+        self._write_task: asyncio.Task[None] | None = None
+
+        # Reused worker threads for blocking file I/O, kept apart from the
+        # default executor so bursts of file access can't starve other users
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="qi-file-db"
+        )
 
         log.info(f"JsonFileDbAdapter initialized with data directory: {self._data_dir}")
 
-    async def _get_lock(self, file_path: Path) -> asyncio.Lock:
-        """Get or create a lock for a specific file path."""
-        async with self._master_lock:
-            if file_path not in self._file_locks:
-                self._file_locks[file_path] = asyncio.Lock()
-            return self._file_locks[file_path]
+    async def _run_io(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking file operation on the adapter's I/O thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_executor, partial(function, *args, **kwargs)
+        )
+
+    async def _read(
+        self, file_path: Path, known_fingerprint: tuple[int, int, int] | None
+    ) -> tuple[os.stat_result | None, bytes | None, Any]:
+        """
+        Run _read_blocking, inline for small files if sync_reads is set and
+        on the I/O thread pool otherwise.
+        """
+        if self._sync_reads:
+            result = _read_blocking(file_path, known_fingerprint, _INLINE_READ_SIZE)
+            if result[2] is not _TOO_LARGE:
+                return result
+        return await self._run_io(_read_blocking, file_path, known_fingerprint)
+
+    def close(self) -> None:
+        """Shut down the I/O thread pool. Pending operations are completed."""
+        self._io_executor.shutdown(wait=True)
+
+    async def _write(
+        self, file_path: Path, value: Any, cache_entry: _CacheEntry | None = None
+    ) -> tuple[os.stat_result, bytes]:
+        """
+        Write a file as part of the next write batch.
 
-    def _get_path_for_scope(self, scope: str) -> Path:
-        """Constructs the file path for a given settings scope."""
-        if scope not in ("bundle", "project", "user"):
-            raise ValueError(f"Invalid settings scope: {scope}")
-        return self._settings_dir / f"{scope}.json"
+        Writes issued while a batch is on disk are grouped into the following
+        one, so bursts of set() calls share a worker hop and directory sync.
+        If the file's cache entry is given and the value encodes to the same
+        bytes, the write is skipped.
+
+        Returns:
+            The stat result of the written file and the bytes written
+        """
+        known = None
+        if cache_entry is not None and cache_entry.raw is not None:
+            known = (cache_entry.raw, cache_entry.fingerprint)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending_writes.append((file_path, value, known, future))
+        if self._write_task is None or self._write_task.done():
+            self._write_task = asyncio.create_task(self._write_batches())
+        return await future
+
+    async def _write_batches(self) -> None:
+        """
+        Write pending writes in batches until none are left.
+        """
+        while self._pending_writes:
+            batch, self._pending_writes = self._pending_writes, []
+            try:
+                results = await self._run_io(
+                    _write_batch_blocking,
+                    [item[:3] for item in batch],
+                    self._pretty,
+                )
+            except Exception as e:
+                results = [e] * len(batch)
+
+            for (*_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _get_lock(self, file_path: Path) -> asyncio.Lock:
+        """
+        Get or create a lock for a specific file path. Runs without awaiting,
+        so it can't interleave with other coroutines and needs no lock itself.
+        """
+        lock = self._file_locks.get(file_path)
+        if lock is None:
+            lock = self._file_locks[file_path] = asyncio.Lock()
+        return lock
 
-    def _is_cache_valid(self, key: str, file_path: Path) -> bool:
+    def _get_key_for_scope(self, scope: str) -> str:
+        """Looks up the storage key for a given settings scope."""
+        try:
+            return self._scope_keys[scope]
+        except KeyError:
+            raise ValueError(f"Invalid settings scope: {scope}") from None
+
+    def _file_path(self, key: str) -> Path:
+        """Get the path of the file backing a key."""
+        path = self._fixed_paths.get(key)
+        if path is None:
+            path = self._data_dir / key
+        return path
+
+    def _cache_put(
+        self,
+        key: str,
+        data: Any,
+        raw: bytes | None,
+        fingerprint: tuple[int, int, int] | None,
+        load_time: float,
+    ) -> None:
+        """Store a cache entry, evicting the least recently used ones over the cap."""
+        # Large files keep only their decoded data, instead of both copies
+        if raw is not None and len(raw) > _MAX_CACHED_RAW_SIZE:
+            raw = None
+        self._cache[key] = _CacheEntry(data, raw, fingerprint, load_time)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_cache_entries:
+            self._cache.popitem(last=False)
+
+    def _is_fresh(self, cache_entry: _CacheEntry, now: float) -> bool:
+        """Check if a cache entry is within its TTL, shorter for negative entries."""
+        ttl = (
+            self._cache_ttl
+            if cache_entry.fingerprint is not None
+            else self._negative_ttl
+        )
+        return now - cache_entry.load_time < ttl
+
+    def _is_cache_valid(self, key: str, st: os.stat_result | None) -> bool:
         """
-        Check if the cached data for a key is still valid.
+        Check if the cached data for a key still matches the file on disk.
 
-        A cache entry is valid if:
-        1. It's within the TTL (time-to-live).
-        2. The TTL has expired, but the underlying file has not been modified
-           since the cache was last written.
+        Callers skip this while the entry is within its TTL; once the TTL
+        has expired, the file is stat'ed once and the result is passed in
+        here, so validation never issues a syscall of its own.
 
         Args:
             key: The cache key.
-            file_path: The path to the backing file.
+            st: The stat result of the backing file, or None if it is missing.
 
         Returns:
             True if the cache is valid, False otherwise.
         """
-        if key not in self._cache:
+        cache_entry = self._cache.get(key)
+        if cache_entry is None:
             return False
 
-        cache_entry = self._cache[key]
-        load_time = cache_entry.get("load_time", 0)
-
-        # 1. Check if cache is fresh based on TTL (monotonic clock)
-        if time.monotonic() - load_time < self._cache_ttl:
-            return True
-
-        # 2. TTL expired, check if the file on disk has been modified
-        try:
-            current_mtime = file_path.stat().st_mtime
-            cached_mtime = cache_entry.get("mtime", 0)
-            if current_mtime > cached_mtime:
-                log.debug(f"Cache invalidated for '{key}': file modified on disk.")
-                del self._cache[key]
-                return False
-        except (FileNotFoundError, PermissionError) as e:
-            # If we can't stat the file, invalidate the cache to be safe
-            log.warning(f"Could not stat file '{file_path}' for cache validation: {e}")
+        # Negative entries have no fingerprint and stay valid while the file is missing
+        if _fingerprint(st) != cache_entry.fingerprint:
+            log.debug("Cache invalidated for '%s': file changed on disk.", key)
             del self._cache[key]
             return False
 
-        # 3. TTL expired but file not modified.
-        # We'll re-read to be safe, but this could be optimized if needed.
-        return False
+        return True
 
     async def get(self, key: str) -> dict[str, Any] | None:
         """
@@ -120,38 +517,73 @@ class JsonFileDbAdapter(QiFileDbAdapter):
             key: Path to the JSON file, relative to data_dir
 
         Returns:
-            The loaded JSON data, or None if file not found
+            The loaded JSON data, or None if file not found. The data is
+            shared with the cache and must not be modified, copy it first.
+        """
+        # Fresh entries are served without touching the filesystem
+        cache_entry = self._cache.get(key)
+        if cache_entry is not None and self._is_fresh(cache_entry, time.monotonic()):
+            log.debug("Cache hit for '%s'", key)
+            self._cache.move_to_end(key)
+            return cache_entry.data
+
+        # Concurrent misses on the same key share a single load
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load(key))
+            self._inflight[key] = pending
+            pending.add_done_callback(partial(self._forget_load, key))
+
+        # Shield the shared load so one cancelled caller doesn't cancel the others
+        return await asyncio.shield(pending)
+
+    def _forget_load(self, key: str, load: asyncio.Future[Any]) -> None:
+        """Remove a finished load, unless it was already replaced by a newer one."""
+        if self._inflight.get(key) is load:
+            del self._inflight[key]
+
+    async def _load(self, key: str) -> dict[str, Any] | None:
+        """
+        Load data for a key under its file lock, revalidating or refreshing
+        the cache entry. Called by get() once per key for concurrent misses.
         """
-        file_path = self._data_dir / key
-        lock = await self._get_lock(file_path)
+        file_path = self._file_path(key)
+        lock = self._get_lock(file_path)
 
         async with lock:
-            # Check if cache is valid
-            if self._is_cache_valid(key, file_path):
-                log.debug(f"Cache hit for '{key}'")
-                return self._cache[key].get("data")
-
-            exists = await asyncio.to_thread(file_path.is_file)
-            if not exists:
-                if key in self._cache:
-                    del self._cache[key]
-                return None
+            # A write may have refreshed the entry while we waited on the lock
+            cache_entry = self._cache.get(key)
+            now = time.monotonic()
+            if cache_entry is not None and self._is_fresh(cache_entry, now):
+                return cache_entry.data
 
             try:
-                mtime = (await asyncio.to_thread(file_path.stat)).st_mtime
-
-                def _read_file():
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        return json.load(f)
-
-                data = await asyncio.to_thread(_read_file)
-
-                self._cache[key] = {
-                    "data": data,
-                    "mtime": mtime,
-                    "load_time": time.monotonic(),
-                }
-                log.debug(f"Cache miss for '{key}', loaded from disk.")
+                known_fingerprint = (
+                    cache_entry.fingerprint if cache_entry is not None else None
+                )
+                generation = self._cache_generation
+                st, raw, data = await self._read(file_path, known_fingerprint)
+
+                # Re-read the entry, it may have been evicted or invalidated
+                # while the file was being stat'ed
+                if self._is_cache_valid(key, st):
+                    log.debug("Cache revalidated for '%s'", key)
+                    cache_entry = self._cache[key]._replace(load_time=now)
+                    self._cache[key] = cache_entry
+                    self._cache.move_to_end(key)
+                    return cache_entry.data
+
+                if data is _UNCHANGED:
+                    st, raw, data = await self._read(file_path, None)
+
+                # Don't cache what was read before an invalidate_cache() call
+                if generation == self._cache_generation:
+                    self._cache_put(key, data, raw, _fingerprint(st), now)
+
+                if st is None:
+                    return None
+
+                log.debug("Cache miss for '%s', loaded from disk.", key)
                 return data
             except (json.JSONDecodeError, IOError, FileNotFoundError) as e:
                 log.error(f"Error reading or decoding file {file_path}: {e}")
@@ -159,36 +591,47 @@ class JsonFileDbAdapter(QiFileDbAdapter):
                     del self._cache[key]
                 raise StorageError(f"Failed to read data: {e}")
 
+    async def get_bytes(self, key: str) -> bytes | None:
+        """
+        Retrieve the encoded JSON for a key, as stored on disk.
+
+        Lets response layers send the content without encoding it again.
+
+        Args:
+            key: Path to the JSON file, relative to data_dir
+
+        Returns:
+            The JSON bytes, or None if file not found
+        """
+        data = await self.get(key)
+        if data is None:
+            return None
+        cache_entry = self._cache.get(key)
+        if cache_entry is not None and cache_entry.data is data and cache_entry.raw:
+            return cache_entry.raw
+        # The load wasn't cached (see invalidate_cache()) or the file is too
+        # large to keep its bytes
+        return _json_dumps(data)
+
     async def set(self, key: str, value: dict[str, Any]) -> None:
         """
         Store data by key (file path relative to data_dir).
 
         Args:
             key: Path to the JSON file, relative to data_dir
-            value: Data to store (must be JSON serializable)
+            value: Data to store (must be JSON serializable). It is cached
+                as is, and must not be modified afterwards.
         """
-        file_path = self._data_dir / key
-        lock = await self._get_lock(file_path)
+        file_path = self._file_path(key)
+        lock = self._get_lock(file_path)
 
         async with lock:
-            await asyncio.to_thread(file_path.parent.mkdir, parents=True, exist_ok=True)
-
             try:
-                temp_file_path = file_path.with_suffix(f"{file_path.suffix}.tmp")
-
-                def _write_file():
-                    with open(temp_file_path, "w", encoding="utf-8") as f:
-                        json.dump(value, f, indent=2)
-                    os.replace(temp_file_path, file_path)
-
-                await asyncio.to_thread(_write_file)
+                st, raw = await self._write(file_path, value, self._cache.get(key))
 
-                mtime = (await asyncio.to_thread(file_path.stat)).st_mtime
-                self._cache[key] = {
-                    "data": value,
-                    "mtime": mtime,
-                    "load_time": time.monotonic(),
-                }
+                self._cache_put(key, value, raw, _fingerprint(st), time.monotonic())
+                if key == _BUNDLES_KEY:
+                    self._bundles_snapshot = None
             except (TypeError, IOError) as e:
                 log.error(f"Error writing to file {file_path}: {e}")
                 raise StorageError(f"Failed to write data: {e}")
@@ -203,26 +646,28 @@ class JsonFileDbAdapter(QiFileDbAdapter):
         Returns:
             True if file was deleted, False if not found
         """
-        file_path = self._data_dir / key
-        lock = await self._get_lock(file_path)
+        file_path = self._file_path(key)
+        lock = self._get_lock(file_path)
 
         async with lock:
-            exists = await asyncio.to_thread(file_path.exists)
-            if not exists:
-                return False
-
             try:
-                await asyncio.to_thread(os.remove, file_path)
+                # One hop, a missing file is reported by the remove itself
+                await self._run_io(os.remove, file_path)
                 log.info(f"Deleted file: {file_path}")
-
-                if key in self._cache:
-                    del self._cache[key]
-
-                return True
+                deleted = True
+            except FileNotFoundError:
+                deleted = False
             except IOError as e:
                 log.error(f"Error deleting file {file_path}: {e}")
                 raise StorageError(f"Failed to delete data: {e}")
 
+            if key in self._cache:
+                del self._cache[key]
+            if key == _BUNDLES_KEY:
+                self._bundles_snapshot = None
+
+            return deleted
+
     def invalidate_cache(self, key: str | None = None) -> None:
         """
         Invalidate cache entries.
@@ -230,36 +675,53 @@ class JsonFileDbAdapter(QiFileDbAdapter):
         Args:
             key: Specific key to invalidate, or None to invalidate all
         """
+        if key is None or key == _BUNDLES_KEY:
+            self._bundles_snapshot = None
+
+        # Loads already in flight may have read the file before the
+        # invalidation, they won't cache their result and later get() calls
+        # start a fresh one instead of joining them
+        self._cache_generation += 1
+        if key is None:
+            self._inflight.clear()
+        else:
+            self._inflight.pop(key, None)
+
         if key is None:
             self._cache.clear()
             log.debug("Cleared entire cache")
         elif key in self._cache:
             del self._cache[key]
-            log.debug(f"Invalidated cache for key: {key}")
+            log.debug("Invalidated cache for key: %s", key)
 
     async def list_keys(self, prefix: str = "") -> list[str]:
         """
-        List all keys (file paths) in the data directory.
+        List all keys (JSON file paths) in the data directory.
         An empty prefix lists all keys.
         """
 
         # This method doesn't modify files, so locking is less critical,
-        # but wrapping in to_thread is good practice for potentially slow I/O.
+        # but running it on the I/O pool is good practice for potentially slow I/O.
         def _list_files():
             start_path = self._data_dir / prefix
-            if not start_path.exists():
+            # Walked paths all start with the data dir, slice it off
+            base_len = len(str(self._data_dir)) + 1
+            # Let the walk tell directories, files and missing paths apart
+            # instead of checking the prefix up front
+            try:
+                keys = [path[base_len:] for path in _walk_json_files(start_path)]
+            except FileNotFoundError:
                 return []
-            if start_path.is_dir():
-                return [
-                    str(p.relative_to(self._data_dir))
-                    for p in start_path.rglob("*")
-                    if p.is_file()
-                ]
-            elif start_path.is_file():
-                return [str(start_path.relative_to(self._data_dir))]
-            return []
-
-        return await asyncio.to_thread(_list_files)
+            except NotADirectoryError:
+                # Raised for a file prefix, but also for a path under a file
+                if not os.path.isfile(start_path):
+                    return []
+                keys = [str(start_path)[base_len:]]
+            if os.sep != "/":
+                keys = [key.replace(os.sep, "/") for key in keys]
+            return keys
+
+        return await self._run_io(_list_files)
 
     async def get_settings(self, scope: str) -> dict[str, Any]:
         """
@@ -271,13 +733,11 @@ class JsonFileDbAdapter(QiFileDbAdapter):
         Returns:
             A dictionary of settings for that scope. Returns an empty dict
             if the settings file doesn't exist.
-        """
-        if scope not in ("bundle", "project", "user"):
-            raise ValueError(f"Invalid settings scope: {scope}")
-
-        file_path = self._get_path_for_scope(scope)
-        key = str(file_path.relative_to(self._data_dir))
 
+        Raises:
+            ValueError: If the scope is not a valid settings scope
+        """
+        key = self._get_key_for_scope(scope)
         settings = await self.get(key)
         return settings or {}
 
@@ -288,11 +748,84 @@ class JsonFileDbAdapter(QiFileDbAdapter):
         Args:
             scope: The settings scope ('bundle', 'project', 'user')
             settings: A dictionary of settings to save for that scope.
+
+        Raises:
+            ValueError: If the scope is not a valid settings scope
         """
-        if scope not in ("bundle", "project", "user"):
-            raise ValueError(f"Invalid settings scope: {scope}")
+        key = self._get_key_for_scope(scope)
+        await self.set(key, settings)
 
-        file_path = self._get_path_for_scope(scope)
-        key = str(file_path.relative_to(self._data_dir))
+    async def _bundles_data(self) -> dict[str, Any]:
+        """
+        Get the contents of the bundles file for the bundle methods.
 
-        await self.set(key, settings)
+        Back-to-back calls reuse a short-lived snapshot instead of going
+        through get() again. Writes through this adapter drop the snapshot.
+        """
+        snapshot = self._bundles_snapshot
+        if (
+            snapshot is not None
+            and time.monotonic() - snapshot[0] < _BUNDLES_SNAPSHOT_TTL
+        ):
+            return snapshot[1]
+
+        bundles_data = await self.get(_BUNDLES_KEY) or {}
+        self._bundles_snapshot = (time.monotonic(), bundles_data)
+        return bundles_data
+
+    async def list_bundles(self) -> list[dict[str, Any]]:
+        """
+        List all available bundles.
+
+        Returns:
+            List of bundle dictionaries, each with its name under "id"
+        """
+        bundles_data = await self._bundles_data()
+        # Project the id in with a single merge, the cached dicts are shared
+        return [
+            {**bundle_info, "id": bundle_id}
+            for bundle_id, bundle_info in bundles_data.get("bundles", {}).items()
+        ]
+
+    async def get_bundle(self, bundle_name: str) -> dict[str, Any] | None:
+        """
+        Get information about a specific bundle.
+
+        Args:
+            bundle_name: The name of the bundle
+
+        Returns:
+            Bundle information with its name under "id", or None if not found
+        """
+        bundles_data = await self._bundles_data()
+        bundle_info = bundles_data.get("bundles", {}).get(bundle_name)
+        if bundle_info is None:
+            return None
+        return {**bundle_info, "id": bundle_name}
+
+    async def get_active_bundle(self) -> str:
+        """
+        Get the name of the currently active bundle.
+
+        Returns:
+            The name of the active bundle, or the configured default bundle
+            name if none has been set
+        """
+        bundles_data = await self._bundles_data()
+        return bundles_data.get("active_bundle", qi_launch_config.default_bundle_name)
+
+    async def set_active_bundle(self, bundle_name: str) -> None:
+        """
+        Set the active bundle.
+
+        Args:
+            bundle_name: The name of the bundle to activate
+
+        Raises:
+            ValueError: If bundle does not exist
+        """
+        bundles_data = await self._bundles_data()
+        if bundle_name not in bundles_data.get("bundles", {}):
+            raise ValueError(f"Bundle '{bundle_name}' does not exist")
+
+        await self.set(_BUNDLES_KEY, {**bundles_data, "active_bundle": bundle_name})
@@ -7,8 +7,11 @@ This module provides a central manager for all database operations,
 coordinating between different adapters for authentication and storage.
 """
 
+import asyncio
+import copy
 from typing import Any, Final, Optional, TypeVar
 
+from core.config import qi_launch_config
 from core.db.adapters import (
     AuthenticationError,
     QiAuthAdapter,
@@ -19,6 +22,12 @@ from core.logger import get_logger
 T = TypeVar("T")
 log = get_logger(__name__)
 
+# Settings scopes, in merge order
+_SETTINGS_SCOPES: Final[tuple[str, ...]] = ("bundle", "project", "user")
+
+# Times in a row the background writer tries queued settings saves
+_MAX_SETTINGS_SAVE_ATTEMPTS: Final[int] = 3
+
 
 class QiDbManager:
     """
@@ -35,6 +44,13 @@ class QiDbManager:
         # Current user and token
         self._current_user: dict[str, Any] = {}
         self._current_token: Optional[str] = None
+
+        # In-flight settings reads, so concurrent reads of a scope share one load
+        self._settings_reads: dict[str, asyncio.Future[dict[str, Any]]] = {}
+
+        # Settings saves waiting to be written in the background, latest per scope
+        self._queued_settings: dict[str, dict[str, Any]] = {}
+        self._settings_writer: Optional[asyncio.Task[None]] = None
         log.info("QiDbManager created")
 
     # -------------------- Adapter Management -------------------- #
@@ -224,6 +240,7 @@ class QiDbManager:
     async def get_settings(self, scope: str) -> dict[str, Any]:
         """
         Retrieve settings for a specific scope.
+        Concurrent calls for the same scope share a single adapter read.
 
         Args:
             scope: The settings scope ('bundle', 'project', 'user')
@@ -236,7 +253,38 @@ class QiDbManager:
             ValueError: If the scope is invalid.
         """
         file_adapter = self.get_file_adapter()
-        return await file_adapter.get_settings(scope)
+
+        # Queued saves are the newest state, even before they reach the adapter
+        queued = self._queued_settings.get(scope)
+        if queued is not None:
+            return queued
+
+        # Coalesce concurrent reads of the same scope into a single adapter call
+        pending = self._settings_reads.get(scope)
+        if pending is None:
+            pending = asyncio.ensure_future(file_adapter.get_settings(scope))
+            self._settings_reads[scope] = pending
+            pending.add_done_callback(
+                lambda _, scope=scope: self._settings_reads.pop(scope, None)
+            )
+
+        # Shield the shared read so one cancelled caller doesn't cancel the others
+        return await asyncio.shield(pending)
+
+    async def get_all_settings(self) -> dict[str, dict[str, Any]]:
+        """
+        Retrieve the settings of every scope, reading the scopes concurrently.
+
+        Returns:
+            A dictionary of settings per scope ('bundle', 'project', 'user').
+
+        Raises:
+            RuntimeError: If no file adapter is set.
+        """
+        results = await asyncio.gather(
+            *(self.get_settings(scope) for scope in _SETTINGS_SCOPES)
+        )
+        return dict(zip(_SETTINGS_SCOPES, results))
 
     async def save_settings(self, scope: str, settings: dict[str, Any]) -> None:
         """
@@ -246,13 +294,134 @@ class QiDbManager:
             scope: The settings scope ('bundle', 'project', 'user').
             settings: A dictionary of settings to save.
 
+        A save still queued for the scope is superseded by this one and
+        won't be written afterwards.
+
         Raises:
             RuntimeError: If no file adapter is set.
             ValueError: If the scope is invalid.
         """
         file_adapter = self.get_file_adapter()
+        self._queued_settings.pop(scope, None)
         await file_adapter.save_settings(scope, settings)
 
+    def queue_settings_save(self, scope: str, settings: dict[str, Any]) -> None:
+        """
+        Save settings for a specific scope in the background.
+
+        The settings are visible to get_settings immediately and written by a
+        background task after a short delay (settings_save_delay). Saves
+        queued for the same scope before the write happens are coalesced, the
+        latest one wins, so a burst of saves costs a single write. A
+        save_settings call for the scope during the delay takes over the
+        queued save. Use flush_settings to wait for queued saves to be written.
+
+        Args:
+            scope: The settings scope ('bundle', 'project', 'user').
+            settings: A dictionary of settings to save.
+
+        Raises:
+            RuntimeError: If no file adapter is set.
+        """
+        self.get_file_adapter()
+
+        # Snapshot, so later mutations by the caller can't race the write
+        self._queued_settings[scope] = copy.deepcopy(settings)
+        if self._settings_writer is None or self._settings_writer.done():
+            self._settings_writer = asyncio.create_task(self._write_queued_settings())
+
+    async def flush_settings(self) -> None:
+        """
+        Wait until all queued settings saves have been written.
+
+        Saves the background writer gave up on are attempted once more.
+
+        Raises:
+            StorageError: If a queued save still can't be written, it stays
+                queued.
+        """
+        if self._settings_writer is not None:
+            await asyncio.shield(self._settings_writer)
+        await self._write_queued_once()
+
+    def flush_settings_threadsafe(self, timeout: float | None = None) -> None:
+        """
+        Wait until all queued settings saves have been written, from a thread
+        other than the one running the event loop the saves were queued on.
+        Used on application shutdown.
+
+        Args:
+            timeout: Seconds to wait for the writes, or None to wait forever.
+
+        Raises:
+            StorageError: If a queued save can't be written.
+            TimeoutError: If the writes don't finish in time.
+        """
+        writer = self._settings_writer
+        if writer is not None and writer.get_loop().is_running():
+            asyncio.run_coroutine_threadsafe(
+                self.flush_settings(), writer.get_loop()
+            ).result(timeout)
+        elif self._queued_settings:
+            # The loop that queued the saves is gone, write them on a new one
+            self._settings_writer = None
+            asyncio.run(self.flush_settings())
+
+    async def _write_queued_once(self) -> None:
+        """
+        Write every queued settings save once. Failed saves stay queued, and
+        the first failure is raised after the others have been attempted.
+        """
+        if not self._queued_settings:
+            return
+
+        file_adapter = self.get_file_adapter()
+        error: Exception | None = None
+        for scope in list(self._queued_settings):
+            settings = self._queued_settings.get(scope)
+            # Skip scopes taken over by a direct save_settings call
+            if settings is None:
+                continue
+
+            try:
+                await file_adapter.save_settings(scope, settings)
+            except Exception as e:
+                error = error or e
+                continue
+
+            # Keep the entry if a newer save was queued while writing
+            if self._queued_settings.get(scope) is settings:
+                del self._queued_settings[scope]
+
+        if error is not None:
+            raise error
+
+    async def _write_queued_settings(self) -> None:
+        """
+        Write queued settings saves until the queue is empty.
+
+        Failed saves stay queued and are retried, up to
+        _MAX_SETTINGS_SAVE_ATTEMPTS times in a row. After that they are left
+        queued for flush_settings or the next queued save.
+        """
+        failures = 0
+        while self._queued_settings:
+            # Let the rest of a burst of saves land before writing
+            await asyncio.sleep(qi_launch_config.settings_save_delay * 2**failures)
+
+            try:
+                await self._write_queued_once()
+                failures = 0
+            except Exception:
+                failures += 1
+                if failures >= _MAX_SETTINGS_SAVE_ATTEMPTS:
+                    log.exception(
+                        f"Failed to save queued settings for {list(self._queued_settings)}, "
+                        "keeping them queued."
+                    )
+                    return
+                log.warning("Failed to save queued settings, retrying.", exc_info=True)
+
     # -------------------- Generic Data Storage -------------------- #
 
     async def get_data(self, key: str) -> dict[str, Any] | None:
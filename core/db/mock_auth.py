@@ -8,7 +8,9 @@ and projects. It does not connect to any external service.
 """
 
 import asyncio
+import secrets
 import time
+from collections import OrderedDict
 from typing import Any
 
 from core.db.adapters import AuthenticationError, QiAuthAdapter
@@ -25,7 +27,25 @@ class MockAuthAdapter(QiAuthAdapter):
     across application restarts.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        simulate_latency: bool = False,
+        token_ttl: float = 3600.0,
+        max_tokens: int = 1024,
+    ):
+        """
+        Initialize the mock auth adapter.
+
+        Args:
+            simulate_latency: Sleep in each call to imitate a remote service
+            token_ttl: Seconds a token stays valid after login
+            max_tokens: Number of active tokens kept before the oldest ones
+                are dropped
+        """
+        self._simulate_latency = simulate_latency
+        self._token_ttl = token_ttl
+        self._max_tokens = max_tokens
+
         self._users = {
             "admin": {
                 "id": "user-001",
@@ -62,8 +82,11 @@ class MockAuthAdapter(QiAuthAdapter):
             },
         ]
 
-        # Map of active tokens to user info
-        self._active_tokens: dict[str, dict[str, Any]] = {}
+        # Map of active tokens to user info and expiry time, oldest first.
+        # Every token gets the same TTL, so the oldest token expires first.
+        self._active_tokens: OrderedDict[str, tuple[dict[str, Any], float]] = (
+            OrderedDict()
+        )
 
         log.info("MockAuthAdapter initialized with test users and projects")
 
@@ -82,7 +105,8 @@ class MockAuthAdapter(QiAuthAdapter):
             AuthenticationError: If credentials are invalid
         """
         # Simulate network delay
-        await asyncio.sleep(0.1)
+        if self._simulate_latency:
+            await asyncio.sleep(0.1)
 
         if username not in self._users:
             log.warning(f"Login attempt with unknown username: {username}")
@@ -93,8 +117,8 @@ class MockAuthAdapter(QiAuthAdapter):
             log.warning(f"Failed login attempt for user: {username}")
             raise AuthenticationError("Invalid credentials")
 
-        # Generate a simple token (in a real system, this would be a JWT)
-        token = f"{username}-{int(time.time())}-{hash(password) % 10000:04d}"
+        # Generate an opaque random token (in a real system, this would be a JWT)
+        token = secrets.token_urlsafe(16)
 
         # Store token -> user mapping
         user_info = {
@@ -102,7 +126,10 @@ class MockAuthAdapter(QiAuthAdapter):
             "name": user["name"],
             "roles": user["roles"],
         }
-        self._active_tokens[token] = user_info
+        self._evict_tokens()
+        self._active_tokens[token] = (user_info, time.monotonic() + self._token_ttl)
+        while len(self._active_tokens) > self._max_tokens:
+            self._active_tokens.popitem(last=False)
 
         log.info(f"User {username} logged in successfully")
         return {
@@ -110,6 +137,13 @@ class MockAuthAdapter(QiAuthAdapter):
             "user": user_info,
         }
 
+    def _evict_tokens(self) -> None:
+        """Drop expired tokens, which are always the oldest ones."""
+        now = time.monotonic()
+        tokens = self._active_tokens
+        while tokens and next(iter(tokens.values()))[1] <= now:
+            tokens.popitem(last=False)
+
     async def validate_token(self, token: str) -> dict[str, Any]:
         """
         Validate an authentication token.
@@ -124,13 +158,16 @@ class MockAuthAdapter(QiAuthAdapter):
             AuthenticationError: If token is invalid
         """
         # Simulate network delay
-        await asyncio.sleep(0.05)
+        if self._simulate_latency:
+            await asyncio.sleep(0.05)
 
-        if token not in self._active_tokens:
+        self._evict_tokens()
+        entry = self._active_tokens.get(token)
+        if entry is None:
             log.warning(f"Invalid token validation attempt: {token}")
             raise AuthenticationError("Invalid or expired token")
 
-        user_info = self._active_tokens[token]
+        user_info = entry[0]
         return {
             "token": token,
             "user": user_info,
@@ -153,7 +190,8 @@ class MockAuthAdapter(QiAuthAdapter):
         await self.validate_token(token)
 
         # Simulate network delay
-        await asyncio.sleep(0.2)
+        if self._simulate_latency:
+            await asyncio.sleep(0.2)
 
         # In a real system, we would filter projects by user permissions
         # For the mock, we return all projects
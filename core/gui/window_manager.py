@@ -27,7 +27,7 @@ class QiWindowManager:
         self._windows: dict[str, webview.Window] = {}
 
     def _on_closed(self, window_id: str):
-        log.debug(f"Window '{window_id}' closed by user, removing from registry.")
+        log.debug("Window '%s' closed by user, removing from registry.", window_id)
         if window_id in self._windows:
             del self._windows[window_id]
 
@@ -78,7 +78,7 @@ class QiWindowManager:
             # We only need to know when the user closes the window to clean up our registry
             window.events.closed += partial(self._on_closed, window_id)
 
-            log.debug(f"Created window '{window_id}' for addon '{addon}'.")
+            log.debug("Created window '%s' for addon '%s'.", window_id, addon)
             return window_id
 
         except Exception as e:
@@ -103,7 +103,7 @@ class QiWindowManager:
 
     def run(self, *args: Any, **kwargs: Any) -> None:
         """Run the webview server and the event loop."""
-        log.debug(f"Running webview.start with debug={qi_launch_config.dev_mode}.")
+        log.debug("Running webview.start with debug=%s.", qi_launch_config.dev_mode)
         webview.start(*args, debug=qi_launch_config.dev_mode, **kwargs)
 
     def exit(self) -> None:
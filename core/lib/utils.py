@@ -5,8 +5,12 @@ This module contains utility functions for the core library.
 """
 
 import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
 from concurrent.futures import ProcessPoolExecutor
 from functools import partial
+from typing import Any
 
 _cpu_executor = ProcessPoolExecutor()
 
@@ -19,3 +23,50 @@ def cpu_bound(func):
         return await loop.run_in_executor(_cpu_executor, partial(func, *args, **kwargs))
 
     return wrapper
+
+
+class QiTTLCache:
+    """
+    A small size-bounded cache whose entries expire after a fixed TTL.
+    Once max_size is reached, the least recently used entry is evicted.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 128) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        # key → (expires_at, value), ordered from least to most recently used
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Return the cached value for key, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Cache value under key for the configured TTL.
+        """
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """
+        Drop the entry for key, or every entry if key is None.
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -6,6 +6,7 @@ This module contains the message bus for the Qi system.
 
 import asyncio
 import inspect
+from functools import partial
 from typing import Any, List
 from uuid import uuid4
 
@@ -101,16 +102,17 @@ class QiMessageBus:
             A decorator that schedules an asyncio task to register the function.
         """
 
-        def decorator(function: Any) -> Any:
-            # Schedule asynchronous registration (fire-and-forget)
-            asyncio.create_task(
-                self._handler_registry.register(
-                    handler_fn=function, topic=topic, session_id=session_id
-                )
-            )
-            return function
+        return partial(self._schedule_registration, topic, session_id)
 
-        return decorator
+    def _schedule_registration(self, topic: str, session_id: str, function: Any) -> Any:
+        """Schedule a handler's registration, returning it unchanged. Used by on."""
+        # Schedule asynchronous registration (fire-and-forget)
+        asyncio.create_task(
+            self._handler_registry.register(
+                handler_fn=function, topic=topic, session_id=session_id
+            )
+        )
+        return function
 
     ########### PUBLISH VS REQUEST ###########
 
@@ -5,6 +5,7 @@ This module contains the hub for the Qi system.
 """
 
 import asyncio
+from functools import partial
 from typing import Any, Final
 
 from core.constants import HUB_ID
@@ -47,8 +48,8 @@ class QiHub:
 
     def __init__(self) -> None:
         self._bus = QiMessageBus()
-        # event_name → [callback_fn]
-        self._event_hooks: dict[str, list[Any]] = {}
+        # event_name → [(callback_fn, is_async)], checked once at registration
+        self._event_hooks: dict[str, list[tuple[Any, bool]]] = {}
 
     ########### SESSION LIFECYCLE (Facade) ###########
 
@@ -98,11 +99,13 @@ class QiHub:
         Currently, hooks are stored internally and fired manually by register()/unregister().
         """
 
-        def decorator(callback_fn: Any) -> Any:
-            self._event_hooks.setdefault(event_name, []).append(callback_fn)
-            return callback_fn
+        return partial(self._add_event_hook, event_name)
 
-        return decorator
+    def _add_event_hook(self, event_name: str, callback_fn: Any) -> Any:
+        """Store a lifecycle hook, returning it unchanged. Used by on_event."""
+        is_async = asyncio.iscoroutinefunction(callback_fn)
+        self._event_hooks.setdefault(event_name, []).append((callback_fn, is_async))
+        return callback_fn
 
     async def _fire(self, event_name: str, *args: Any) -> None:
         """
@@ -111,12 +114,13 @@ class QiHub:
             event_name: the event to fire
             *args: arguments to pass to the hooks
         """
-        if event_name not in self._event_hooks:
+        hooks = self._event_hooks.get(event_name)
+        if not hooks:
             return
 
-        for hook in self._event_hooks[event_name]:
+        for hook, is_async in hooks:
             try:
-                if asyncio.iscoroutinefunction(hook):
+                if is_async:
                     await hook(*args)
                 else:
                     # Run sync hooks in a thread pool
@@ -4,6 +4,7 @@
 This module contains the models for the Qi system.
 """
 
+import sys
 import time
 from enum import Enum
 from typing import Any, Awaitable, Callable, TypeAlias
@@ -19,6 +20,9 @@ TupleKey2: TypeAlias = tuple[str | None, str | None]
 TupleKey3: TypeAlias = tuple[str | None, str | None, str | None]
 """Type alias for a tuple of three strings or None."""
 
+_INTERN_MAX_LEN = 256
+"""Env values at least this long are not interned."""
+
 QiCallback: TypeAlias = Callable[..., Any]
 """Type alias for a generic callback function used in event handling or hooks."""
 
@@ -43,6 +47,9 @@ class QiBaseModel(BaseModel):
         extra="forbid"
         if qi_launch_config.dev_mode
         else "allow",  # Forbid extra fields in dev mode
+        # Build the core schema on first use instead of at import time,
+        # so rarely used models (e.g. QiUser, QiBundleCollection) cost nothing
+        defer_build=True,
     )
 
 
@@ -145,8 +152,11 @@ class QiBundle(QiBaseModel):
     """
     Defines a bundle, which is a collection of addons and environment variables
     that can be activated for a session.
+    Bundles are read-only once loaded from the bundles file.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="The name of the bundle.")
     allow_list: list[str] = Field(
         default_factory=list, description="A list of addon names to allow."
@@ -155,10 +165,24 @@ class QiBundle(QiBaseModel):
         default_factory=dict, description="Environment variables for the bundle."
     )
 
+    @field_validator("env")
+    @classmethod
+    def _intern_env(cls, value: dict[str, str]) -> dict[str, str]:
+        """
+        Interns env keys and short values, which repeat across bundles and
+        are copied into os.environ when a bundle is applied.
+        """
+        return {
+            sys.intern(k): sys.intern(v) if len(v) < _INTERN_MAX_LEN else v
+            for k, v in value.items()
+        }
+
 
 class QiBundleCollection(QiBaseModel):
     """A container for a dictionary of bundles, matching the TOML structure."""
 
+    model_config = ConfigDict(frozen=True)
+
     bundles: dict[str, QiBundle] = Field(
         default_factory=dict, description="A mapping of bundle names to bundle objects."
     )
@@ -7,6 +7,7 @@ This module contains the middleware for the Qi server.
 import json
 import mimetypes
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import Request
@@ -18,6 +19,31 @@ from core.logger import get_logger
 log = get_logger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _resolve_addon_ui_dir(path: str) -> Path:
+    """
+    Resolves an absolute `ui-dist` path that must be an existing directory.
+    Raising calls are not cached, so a UI built later is picked up.
+    """
+    addon_ui_dir = Path(path).resolve(strict=True)
+    if not addon_ui_dir.is_dir():
+        raise NotADirectoryError(path)
+    return addon_ui_dir
+
+
+def _get_addon_ui_dir(addon_name: str) -> Path | None:
+    """
+    Returns the resolved `ui-dist` directory of an addon, or None if the addon
+    has no built UI. Existing directories are cached per absolute path, so
+    they are only resolved and stat'ed on the first request for that addon.
+    """
+    addon_ui_dir = Path(f"addons/{addon_name}/ui-dist").absolute()
+    try:
+        return _resolve_addon_ui_dir(addon_ui_dir.as_posix())
+    except (OSError, RuntimeError):
+        return None
+
+
 class QiDevProxyMiddleware(BaseHTTPMiddleware):
     """
     Middleware for development mode to proxy addon requests to their respective dev servers.
@@ -27,25 +53,37 @@ class QiDevProxyMiddleware(BaseHTTPMiddleware):
     mapping addon names to their dev server URLs).
     It then redirects the request to `dev_server_url/actual_path?original_query_params`.
     This is useful for developing UI addons with hot-reloading development servers.
+    The dev server mapping is read once, when the middleware is created.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        """Proxies requests to addon development servers if applicable."""
+    def __init__(self, app):
+        super().__init__(app)
         dev_servers: dict[str, dict[str, str]] = json.loads(
-            os.getenv("QI_ADDONS", json.dumps({}))
+            os.getenv("QI_ADDONS", "{}")
         )
-        for addon_name, addon_data in dev_servers.items():
-            if request.url.path.startswith(f"/{addon_name}"):
-                # Construct the target URL carefully, preserving the full original path.
-                # Example: request for /addon_name/some/page -> dev_server_url/addon_name/some/page
-                base_dev_url = addon_data["url"].rstrip("/")
-                # request.url.path already includes the leading /addon_name
-                target_url = f"{base_dev_url}{request.url.path}"
-
-                if request.query_params:
-                    target_url += f"?{request.query_params}"
-                log.info(f"Proxying request for '{request.url.path}' to '{target_url}'")
-                return RedirectResponse(url=target_url)
+        # Addon name -> dev server base URL without its trailing slash
+        self._dev_urls: dict[str, str] = {
+            addon_name: addon_data["url"].rstrip("/")
+            for addon_name, addon_data in dev_servers.items()
+        }
+
+    async def dispatch(self, request: Request, call_next):
+        """Proxies requests to addon development servers if applicable."""
+        # The addon name is the first path segment, a single dict lookup
+        # instead of a prefix check per configured addon
+        path = request.url.path
+        addon_name = path[1:].partition("/")[0]
+        base_dev_url = self._dev_urls.get(addon_name)
+        if base_dev_url is not None:
+            # Construct the target URL carefully, preserving the full original path.
+            # Example: request for /addon_name/some/page -> dev_server_url/addon_name/some/page
+            # request.url.path already includes the leading /addon_name
+            target_url = f"{base_dev_url}{path}"
+
+            if request.query_params:
+                target_url += f"?{request.query_params}"
+            log.info(f"Proxying request for '{path}' to '{target_url}'")
+            return RedirectResponse(url=target_url)
 
         return await call_next(request)
 
@@ -82,8 +120,8 @@ class QiSPAStaticFilesMiddleware(BaseHTTPMiddleware):
         parts = path_str.split("/", 1)
         addon_name = parts[0]
 
-        addon_ui_dir = Path(f"addons/{addon_name}/ui-dist").resolve()  # Resolve early
-        if not addon_ui_dir.is_dir():
+        addon_ui_dir = _get_addon_ui_dir(addon_name)
+        if addon_ui_dir is None:
             return await call_next(request)
 
         # Determine the path relative to the addon_ui_dir
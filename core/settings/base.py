@@ -164,6 +164,7 @@ class QiGroup:
         # run-time data
         self._model_cls: type[BaseModel] | None = None
         self._model_instance: BaseModel | None = None
+        self._model_schema: dict[str, Any] | None = None
         self._lock = RLock()
 
     # ------------ deepcopy (inherit) ------------ #
@@ -233,6 +234,7 @@ class QiGroup:
             "_parent_key",
             "_model_cls",
             "_model_instance",
+            "_model_schema",
             "_lock",
             "list_mode",
             "modifiable",
@@ -317,10 +319,15 @@ class QiGroup:
 
     def _clear_defaults_recursive(self) -> None:
         """Clear defaults recursively from this group and all children."""
-        self._defaults = {}
-        for child in self._children.values():
-            if isinstance(child, QiGroup):
-                child._clear_defaults_recursive()
+        stack: list[QiGroup] = [self]
+        while stack:
+            group = stack.pop()
+            group._defaults = {}
+            stack.extend(
+                child
+                for child in group._children.values()
+                if isinstance(child, QiGroup)
+            )
 
     # ------------- defaults machinery ------------- #
     def _apply_defaults(self) -> None:
@@ -499,6 +506,7 @@ class QiGroup:
             cache: dict[str, type[BaseModel]] = {}
             self._model_cls = self._build_model(self.title or "RootModel", cache)
             self._model_instance = self._model_cls(**{})
+            self._model_schema = None
 
     # -------------- read helpers ------------- #
     def _assert_built(self) -> None:
@@ -516,7 +524,11 @@ class QiGroup:
     def get_model_schema(self) -> dict[str, Any]:
         self._assert_built()
         with self._lock:
-            return self._model_cls.model_json_schema()
+            # JSON schema generation walks the whole core schema, so it is done
+            # once per build and callers get their own copy of the result.
+            if self._model_schema is None:
+                self._model_schema = self._model_cls.model_json_schema()
+            return deepcopy(self._model_schema)
 
     def get_runtime_value(self, name: str) -> Any:
         """
@@ -527,6 +539,44 @@ class QiGroup:
         with self._lock:
             return getattr(self._model_instance, name)
 
+    def get_value_at(self, keys: list[str]) -> Any:
+        """
+        Get the plain value found by walking `keys` down the model instance.
+        Only the addressed subtree is dumped, unlike get_values() which dumps
+        the whole model.
+
+        Raises
+        ------
+        KeyError
+            If any key along the path does not exist.
+        """
+        self._assert_built()
+        with self._lock:
+            node: Any = self._model_instance
+            for key in keys:
+                if isinstance(node, BaseModel):
+                    if key not in type(node).model_fields:
+                        raise KeyError(key)
+                    node = getattr(node, key)
+                elif isinstance(node, dict):
+                    node = node[key]
+                else:
+                    raise KeyError(key)
+            return _dump_value(node)
+
+
+def _dump_value(value: Any) -> Any:
+    """
+    Convert a runtime value to plain python data, as model_dump() would.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, dict):
+        return {k: _dump_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_dump_value(v) for v in value]
+    return value
+
 
 # ────────────────────────────────────────────────────────────
 #  Root node – QiSettings
@@ -4,6 +4,10 @@
 This module contains the message handlers for the settings service.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
 from core.constants import HUB_ID
 from core.logger import get_logger
 from core.messaging.hub import qi_hub
@@ -11,6 +15,9 @@ from core.settings.manager import qi_settings_manager
 
 log = get_logger(__name__)
 
+# Reply for a successful patch, built once instead of per message
+_PATCH_SUCCESS: Final[Mapping[str, Any]] = MappingProxyType({"success": True})
+
 
 def register_settings_handlers() -> None:
     """
@@ -66,21 +73,29 @@ def register_settings_handlers() -> None:
             return {"error": str(e)}
 
     @qi_hub.on("config.patch", session_id=HUB_ID)
-    async def handle_config_patch(message: dict) -> dict:
+    async def handle_config_patch(message: dict) -> Mapping[str, Any]:
         """
         Handles requests to update a configuration value.
+
+        Payload:
+            scope (str): The settings scope to patch.
+            path (str): The dot-separated path to the setting.
+            value (any): The new value.
+            sync (bool, optional): Reply only once the value is saved to the
+                                   database. By default the save is queued.
         """
         payload = message.get("payload", {})
         scope = payload.get("scope")  # e.g., "user"
         path = payload.get("path")
         value = payload.get("value")
+        sync = bool(payload.get("sync", False))
 
         if not all([scope, path]):
             return {"success": False, "error": "Scope and path are required."}
 
         try:
-            await qi_settings_manager.patch_value(scope, path, value)
-            return {"success": True}
+            await qi_settings_manager.patch_value(scope, path, value, sync=sync)
+            return _PATCH_SUCCESS
         except Exception as e:
             log.error(f"Error patching setting: {e}")
             return {"success": False, "error": str(e)}
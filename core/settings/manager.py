@@ -5,6 +5,7 @@ This module contains the manager for the Qi settings.
 """
 
 import asyncio
+import copy
 from typing import Any, Final, Optional
 
 from deepmerge import always_merger
@@ -12,7 +13,7 @@ from deepmerge import always_merger
 from core.addon.manager import qi_addon_manager
 from core.bundle.manager import qi_bundle_manager
 from core.db.manager import qi_db_manager
-from core.logger import get_logger
+from core.logger import DEBUG, get_logger
 from core.messaging.hub import qi_hub
 from core.settings.base import QiGroup, QiSettings
 
@@ -26,19 +27,15 @@ def _set_nested_value(data: dict, path: str, value: Any) -> None:
 
     keys = path.split(".")
     current_level = data
-    for i, key in enumerate(keys[:-1]):
-        current_level = current_level.setdefault(key, {})
-        if not isinstance(current_level, dict):
+    for key in keys[:-1]:
+        next_level = current_level.setdefault(key, {})
+        if not isinstance(next_level, dict):
             log.warning(
                 f"Cannot set nested value for path '{path}'. Part '{key}' is not a dictionary."
             )
-            # Overwrite the non-dict part to proceed
-            current_level = {}
-            if i > 0:
-                parent_level = data
-                for p_key in keys[:i]:
-                    parent_level = parent_level[p_key]
-                parent_level[key] = current_level
+            # Overwrite the non-dict part in place to proceed
+            next_level = current_level[key] = {}
+        current_level = next_level
     current_level[keys[-1]] = value
 
 
@@ -56,7 +53,7 @@ class QiSettingsManager:
         self._build_lock = asyncio.Lock()
 
         # When the active bundle changes, trigger a settings rebuild
-        qi_hub.on_event("bundle.active.changed", self.rebuild_settings)
+        qi_hub.on_event("bundle.active.changed")(self.rebuild_settings)
 
     def _collect_addon_defaults(self) -> None:
         """
@@ -72,7 +69,7 @@ class QiSettingsManager:
                 if addon_def:
                     # Use __setattr__ directly since add_child is not implemented
                     setattr(addon_settings, addon.name, addon_def)
-                    log.debug(f"Collected settings from addon: {addon.name}")
+                    log.debug("Collected settings from addon: %s", addon.name)
             except Exception:
                 log.exception(f"Failed to get settings definition from {addon.name}")
 
@@ -149,7 +146,7 @@ class QiSettingsManager:
         self._is_built = True
 
         log.info("--- Finished Settings Build ---")
-        if log.isEnabledFor(log.DEBUG):
+        if log.isEnabledFor(DEBUG):
             log.debug("Final effective settings:\n%s", self._root_settings.get_values())
 
     async def rebuild_settings(self) -> None:
@@ -173,13 +170,9 @@ class QiSettingsManager:
             log.error("Cannot get value: settings have not been built yet.")
             return default
 
-        keys = path.split(".")
-        value = self._root_settings.get_values()
         try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
+            return self._root_settings.get_value_at(path.split("."))
+        except KeyError:
             log.warning(f"Settings path not found: {path}")
             return default
 
@@ -220,7 +213,9 @@ class QiSettingsManager:
 
         return current
 
-    async def patch_value(self, scope: str, path: str, value: Any) -> None:
+    async def patch_value(
+        self, scope: str, path: str, value: Any, *, sync: bool = False
+    ) -> None:
         """
         Updates a setting value and persists it to the database.
 
@@ -228,6 +223,8 @@ class QiSettingsManager:
             scope: The settings scope ('bundle', 'project', 'user')
             path: Dot-separated path to the setting
             value: New value for the setting
+            sync: Wait for the write to reach the database before returning,
+                  instead of queueing it in the background
 
         Raises:
             RuntimeError: If settings have not been built yet
@@ -254,25 +251,33 @@ class QiSettingsManager:
             # 1. Get the name of the bundle to be patched.
             active_bundle_name = self._bundle_manager.get_active_bundle().name
 
-            # 2. Load all current settings for the 'bundle' scope.
+            # 2. Load all current settings for the 'bundle' scope. The result
+            # is shared with the storage cache, so copy before changing it.
             all_bundle_settings = await self._db_manager.get_settings("bundle")
             if not isinstance(all_bundle_settings, dict):
                 all_bundle_settings = {}
+            all_bundle_settings = dict(all_bundle_settings)
 
-            # 3. Get or create the settings dict for the specific active bundle.
-            target_bundle_settings = all_bundle_settings.setdefault(
-                active_bundle_name, {}
+            # 3. Copy or create the settings dict for the specific active
+            # bundle, the other bundles' settings are left untouched.
+            target_bundle_settings = copy.deepcopy(
+                all_bundle_settings.get(active_bundle_name, {})
             )
+            all_bundle_settings[active_bundle_name] = target_bundle_settings
 
             # 4. Update the settings dict with the new value at the specified path.
             _set_nested_value(target_bundle_settings, path, value)
 
-            # 5. Save the entire updated settings object back to the database.
-            await self._db_manager.save_settings(scope, all_bundle_settings)
+            # 5. Save the entire updated settings object back to the database,
+            # in the background unless the caller needs it on disk first.
+            if sync:
+                await self._db_manager.save_settings(scope, all_bundle_settings)
+            else:
+                self._db_manager.queue_settings_save(scope, all_bundle_settings)
 
             # 6. Rebuild the in-memory settings model to apply the change.
             # This is inefficient for frequent updates but guarantees consistency.
-            log.debug(f"Rebuilding settings model to apply patch for '{path}'...")
+            log.debug("Rebuilding settings model to apply patch for '%s'...", path)
             self._is_built = False  # Allow build_settings to run again
             await self.build_settings()
 
@@ -11,7 +11,7 @@ import tomllib
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Base paths
@@ -134,10 +134,17 @@ class AppConfig(BaseSettings):
         # Initialize with merged settings
         super().__init__(**merged_kwargs)
 
-        # Update log level based on dev_mode
+    @model_validator(mode="after")
+    def _dev_mode_setup(self) -> AppConfig:
+        """
+        If dev mode is enabled and the log level was left at its default,
+        set the log level to DEBUG.
+        """
         if self.dev_mode and self.log_level == "INFO":
             self.log_level = "DEBUG"
 
+        return self
+
     @property
     def server(self) -> ServerConfig:
         """
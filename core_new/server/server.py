@@ -108,12 +108,12 @@ class ServerManager(ManagerBase):
     @property
     def host(self) -> str:
         """Get the host to bind to."""
-        return app_config.server.host
+        return app_config.server_host
 
     @property
     def port(self) -> int:
         """Get the port to bind to."""
-        return app_config.server.port
+        return app_config.server_port
 
     async def initialize(self) -> None:
         """Initializes the server manager. A no-op for this manager."""
@@ -125,15 +125,16 @@ class ServerManager(ManagerBase):
 
         This method starts the server in a background task.
         """
-        log.info(f"Starting server on {self.host}:{self.port}")
+        server_config = app_config.server
+        log.info(f"Starting server on {server_config.host}:{server_config.port}")
 
         config = uvicorn.Config(
             app=self.app,
-            host=self.host,
-            port=self.port,
+            host=server_config.host,
+            port=server_config.port,
             log_level="debug" if app_config.dev_mode else "info",
-            ssl_keyfile=app_config.server.ssl_key_path,
-            ssl_certfile=app_config.server.ssl_cert_path,
+            ssl_keyfile=server_config.ssl_key_path,
+            ssl_certfile=server_config.ssl_cert_path,
         )
 
         self._server = uvicorn.Server(config)
@@ -174,8 +175,9 @@ class ServerManager(ManagerBase):
         Returns:
             The URL of the server.
         """
-        protocol = "https" if app_config.server.use_ssl else "http"
-        return f"{protocol}://{self.host}:{self.port}"
+        server_config = app_config.server
+        protocol = "https" if server_config.use_ssl else "http"
+        return f"{protocol}://{server_config.host}:{server_config.port}"
 
 
 # Create a global server manager instance
@@ -0,0 +1,295 @@
+import asyncio
+import inspect
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.constants import HUB_ID
+from core.db.adapters import AuthenticationError, StorageError
+from core.db.bus_handlers import (
+    _DB_HANDLER_TOPICS,
+    _bounded,
+    _DbHandlerService,
+    _handler_calls,
+    _handler_latency_ns,
+    _handler_rejections,
+    register_db_handlers,
+)
+from core.models import QiMessage, QiMessageType, QiSession
+
+
+def test_register_db_handlers_subscribes_every_topic():
+    mock_hub = MagicMock()
+    with patch("core.db.bus_handlers.qi_hub", mock_hub):
+        register_db_handlers()
+
+    registered = [call.args[0] for call in mock_hub.on.call_args_list]
+    assert registered == [topic for topic, _ in _DB_HANDLER_TOPICS]
+    for call in mock_hub.on.call_args_list:
+        assert call.kwargs == {"session_id": HUB_ID}
+
+    handlers = [call.args[0] for call in mock_hub.on.return_value.call_args_list]
+    assert [handler.__name__ for handler in handlers] == [
+        name for _, name in _DB_HANDLER_TOPICS
+    ]
+
+
+def test_register_db_handlers_binds_the_given_manager():
+    mock_hub = MagicMock()
+    db_manager = MagicMock()
+    with patch("core.db.bus_handlers.qi_hub", mock_hub):
+        register_db_handlers(db_manager)
+
+    handler = mock_hub.on.return_value.call_args_list[0].args[0]
+    assert inspect.unwrap(handler).__self__.db_manager is db_manager
+
+
+@pytest.mark.asyncio
+async def test_login_passes_credentials_to_manager():
+    db_manager = MagicMock()
+    db_manager.login = AsyncMock(return_value={"token": "t"})
+    service = _DbHandlerService(db_manager)
+
+    result = await service.handle_auth_login(
+        {"payload": {"username": "user", "password": "pass"}}
+    )
+
+    assert result == {"token": "t"}
+    db_manager.login.assert_awaited_once_with("user", "pass")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "message",
+    [
+        {},
+        {"payload": {}},
+        {"payload": {"username": "user"}},
+        {"payload": {"username": "user", "password": ""}},
+    ],
+)
+async def test_login_rejects_missing_credentials(message):
+    db_manager = MagicMock()
+    db_manager.login = AsyncMock()
+    service = _DbHandlerService(db_manager)
+
+    with pytest.raises(AuthenticationError):
+        await service.handle_auth_login(message)
+    db_manager.login.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_validate_is_cached_until_logout():
+    db_manager = MagicMock()
+    db_manager.get_current_token.return_value = None
+    db_manager.validate_token = AsyncMock(return_value={"user": {"id": "1"}})
+    service = _DbHandlerService(db_manager)
+    message = {"payload": {"token": "abc"}}
+
+    assert await service.handle_auth_validate(message) == {"user": {"id": "1"}}
+    assert await service.handle_auth_validate(message) == {"user": {"id": "1"}}
+    db_manager.validate_token.assert_awaited_once_with("abc")
+
+    await service.handle_auth_logout({})
+    await service.handle_auth_validate(message)
+    assert db_manager.validate_token.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_validation_is_not_cached():
+    db_manager = MagicMock()
+    db_manager.validate_token = AsyncMock(side_effect=AuthenticationError("bad"))
+    service = _DbHandlerService(db_manager)
+    message = {"payload": {"token": "abc"}}
+
+    for _ in range(2):
+        with pytest.raises(AuthenticationError):
+            await service.handle_auth_validate(message)
+    assert db_manager.validate_token.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_reports_each_read_separately():
+    db_manager = MagicMock()
+    db_manager.get_current_token.return_value = "abc"
+    db_manager.validate_token = AsyncMock(return_value={"user": {"id": "1"}})
+    db_manager.list_projects = AsyncMock(side_effect=AuthenticationError("nope"))
+    service = _DbHandlerService(db_manager)
+
+    result = await service.handle_db_bootstrap({"payload": {}})
+
+    assert result == {"user": {"user": {"id": "1"}}, "projects": {"error": "nope"}}
+
+
+def _registered_handlers(db_manager):
+    """Register the db handlers against a mock hub, returning topic → handler."""
+    mock_hub = MagicMock()
+    with patch("core.db.bus_handlers.qi_hub", mock_hub):
+        register_db_handlers(db_manager)
+    topics = [call.args[0] for call in mock_hub.on.call_args_list]
+    handlers = [call.args[0] for call in mock_hub.on.return_value.call_args_list]
+    return dict(zip(topics, handlers))
+
+
+@pytest.mark.asyncio
+async def test_adapter_errors_are_logged_and_reraised():
+    db_manager = MagicMock()
+    db_manager.get_current_token.return_value = "abc"
+    db_manager.list_projects = AsyncMock(side_effect=AuthenticationError("expired"))
+    handler = _registered_handlers(db_manager)["db_service.project.list"]
+
+    with (
+        patch("core.db.bus_handlers.log") as mock_log,
+        pytest.raises(AuthenticationError),
+    ):
+        await handler({})
+    mock_log.error.assert_called_once()
+    db_manager.list_projects.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unexpected_errors_propagate_without_handler_logging():
+    db_manager = MagicMock()
+    db_manager.get_current_token.return_value = "abc"
+    db_manager.list_projects = AsyncMock(side_effect=RuntimeError("no adapter"))
+    handler = _registered_handlers(db_manager)["db_service.project.list"]
+
+    with patch("core.db.bus_handlers.log") as mock_log, pytest.raises(RuntimeError):
+        await handler({})
+    mock_log.error.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_storage_errors_are_retried():
+    db_manager = MagicMock()
+    db_manager.get_current_token.return_value = "abc"
+    db_manager.list_projects = AsyncMock(
+        side_effect=[StorageError("busy"), StorageError("busy"), [{"id": "p"}]]
+    )
+    handler = _registered_handlers(db_manager)["db_service.project.list"]
+
+    with patch("core.db.bus_handlers.asyncio.sleep", AsyncMock()) as mock_sleep:
+        assert await handler({}) == [{"id": "p"}]
+    assert db_manager.list_projects.await_count == 3
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [0.1, 0.2]
+
+
+@pytest.mark.asyncio
+async def test_storage_errors_give_up_after_last_attempt():
+    db_manager = MagicMock()
+    db_manager.get_current_token.return_value = "abc"
+    db_manager.list_projects = AsyncMock(side_effect=StorageError("down"))
+    handler = _registered_handlers(db_manager)["db_service.project.list"]
+
+    with (
+        patch("core.db.bus_handlers.asyncio.sleep", AsyncMock()),
+        pytest.raises(StorageError),
+    ):
+        await handler({})
+    assert db_manager.list_projects.await_count == 3
+
+
+def test_handler_service_has_no_instance_dict():
+    service = _DbHandlerService(MagicMock())
+    assert not hasattr(service, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_registered_handlers_are_metered():
+    handlers = _registered_handlers(MagicMock())
+    index = [topic for topic, _ in _DB_HANDLER_TOPICS].index("auth.logout")
+    calls_before = _handler_calls[index]
+    latency_before = _handler_latency_ns[index]
+
+    await handlers["auth.logout"]({})
+    stats = await handlers["db_service.stats"]({})
+
+    assert _handler_calls[index] == calls_before + 1
+    assert _handler_latency_ns[index] > latency_before
+    assert stats["auth.logout"]["calls"] == calls_before + 1
+
+
+@pytest.mark.asyncio
+async def test_repeated_login_reuses_current_session():
+    db_manager = MagicMock()
+    db_manager.login = AsyncMock(return_value={"token": "t", "user": {"id": "1"}})
+    db_manager.get_current_token.return_value = "t"
+    service = _DbHandlerService(db_manager)
+    message = {"payload": {"username": "user", "password": "pass"}}
+
+    first = await service.handle_auth_login(message)
+    assert await service.handle_auth_login(message) == first
+    db_manager.login.assert_awaited_once()
+
+    # A logout drops the cached login
+    await service.handle_auth_logout({})
+    await service.handle_auth_login(message)
+    assert db_manager.login.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_login_is_briefly_rejected_without_adapter_call():
+    db_manager = MagicMock()
+    db_manager.login = AsyncMock(side_effect=AuthenticationError("bad password"))
+    service = _DbHandlerService(db_manager)
+    message = {"payload": {"username": "user", "password": "wrong"}}
+
+    for _ in range(2):
+        with pytest.raises(AuthenticationError):
+            await service.handle_auth_login(message)
+    db_manager.login.assert_awaited_once()
+
+    # Guessing another password for the same user is rejected too
+    message["payload"]["password"] = "other"
+    with pytest.raises(AuthenticationError):
+        await service.handle_auth_login(message)
+    db_manager.login.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_saturated_handler_replies_busy():
+    release = asyncio.Event()
+
+    async def slow_handler(message):
+        await release.wait()
+        return "done"
+
+    index = [topic for topic, _ in _DB_HANDLER_TOPICS].index("auth.logout")
+    rejected_before = _handler_rejections[index]
+    with (
+        patch("core.db.bus_handlers._MAX_IN_FLIGHT", 1),
+        patch("core.db.bus_handlers._MAX_WAITING", 1),
+    ):
+        bounded = _bounded(index, slow_handler)
+        running = asyncio.create_task(bounded({}))
+        waiting = asyncio.create_task(bounded({}))
+        await asyncio.sleep(0)
+
+        assert await bounded({}) == {"error": "busy", "retry_after": 0.5}
+        assert _handler_rejections[index] == rejected_before + 1
+
+        release.set()
+        assert await asyncio.gather(running, waiting) == ["done", "done"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "message",
+    [
+        {},
+        {"payload": None},
+        QiMessage(
+            topic="auth.validate",
+            type=QiMessageType.REQUEST,
+            sender=QiSession(logical_id="ui"),
+        ),
+    ],
+)
+async def test_registered_handlers_normalize_the_payload(message):
+    db_manager = MagicMock()
+    db_manager.get_current_token.return_value = "current"
+    db_manager.validate_token = AsyncMock(return_value={"user": {"id": "1"}})
+    handler = _registered_handlers(db_manager)["auth.validate"]
+
+    assert await handler(message) == {"user": {"id": "1"}}
+    db_manager.validate_token.assert_awaited_once_with(None)
@@ -0,0 +1,363 @@
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+from core.db.adapters import StorageError
+from core.db.file_db import JsonFileDbAdapter
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    adapter = JsonFileDbAdapter(str(tmp_path))
+    yield adapter
+    adapter.close()
+
+
+async def test_set_get_delete_roundtrip(adapter):
+    await adapter.set("data/item.json", {"a": 1})
+    assert await adapter.get("data/item.json") == {"a": 1}
+    assert await adapter.list_keys("data") == ["data/item.json"]
+    assert await adapter.delete("data/item.json") is True
+    assert await adapter.get("data/item.json") is None
+    assert await adapter.delete("data/item.json") is False
+
+
+async def test_settings_roundtrip(adapter):
+    assert await adapter.get_settings("user") == {}
+    await adapter.save_settings("user", {"theme": "dark"})
+    assert await adapter.get_settings("user") == {"theme": "dark"}
+    with pytest.raises(ValueError):
+        await adapter.get_settings("nope")
+
+
+async def test_file_io_runs_on_adapter_pool(tmp_path):
+    adapter = JsonFileDbAdapter(str(tmp_path), pool_size=1)
+    try:
+        thread_name = await adapter._run_io(lambda: threading.current_thread().name)
+        assert thread_name.startswith("qi-file-db")
+    finally:
+        adapter.close()
+
+
+async def test_sync_reads_only_use_pool_for_large_files(tmp_path, monkeypatch):
+    (tmp_path / "small.json").write_text('{"a": 1}')
+    (tmp_path / "large.json").write_text(json.dumps({"a": "x" * 100_000}))
+    adapter = JsonFileDbAdapter(str(tmp_path), sync_reads=True)
+    pooled = []
+    real_run_io = adapter._run_io
+
+    async def run_io(function, *args):
+        pooled.append(args[0].name)
+        return await real_run_io(function, *args)
+
+    monkeypatch.setattr(adapter, "_run_io", run_io)
+    try:
+        assert await adapter.get("small.json") == {"a": 1}
+        assert (await adapter.get("large.json"))["a"] == "x" * 100_000
+        assert pooled == ["large.json"]
+    finally:
+        adapter.close()
+
+
+async def test_get_rereads_file_changed_after_ttl(adapter, tmp_path):
+    await adapter.set("item.json", {"a": 1})
+    path = tmp_path / "item.json"
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text('{"a": 2}')
+    os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert await adapter.get("item.json") == {"a": 1}
+
+    adapter._cache_ttl = 0
+    assert await adapter.get("item.json") == {"a": 2}
+    path.unlink()
+    assert await adapter.get("item.json") is None
+    assert adapter._cache["item.json"].data is None
+
+
+async def test_concurrent_gets_share_one_load(adapter, monkeypatch):
+    await adapter.set("item.json", {"a": 1})
+    adapter.invalidate_cache()
+    loads = 0
+    load = adapter._load
+
+    async def counting_load(key):
+        nonlocal loads
+        loads += 1
+        return await load(key)
+
+    monkeypatch.setattr(adapter, "_load", counting_load)
+    results = await asyncio.gather(*(adapter.get("item.json") for _ in range(5)))
+    assert results == [{"a": 1}] * 5
+    assert loads == 1
+    assert adapter._inflight == {}
+
+
+async def test_get_bytes_returns_stored_json(adapter, tmp_path):
+    await adapter.set("item.json", {"a": 1})
+    assert await adapter.get_bytes("item.json") == (tmp_path / "item.json").read_bytes()
+    adapter.invalidate_cache()
+    assert json.loads(await adapter.get_bytes("item.json")) == {"a": 1}
+    assert await adapter.get_bytes("missing.json") is None
+
+
+async def test_bundles(adapter):
+    assert await adapter.list_bundles() == []
+    await adapter.set(
+        "bundles/bundles.json",
+        {"bundles": {"dev": {"env": {"A": "1"}}, "prod": {}}, "active_bundle": "prod"},
+    )
+    assert await adapter.list_bundles() == [
+        {"env": {"A": "1"}, "id": "dev"},
+        {"id": "prod"},
+    ]
+    assert await adapter.get_bundle("dev") == {"env": {"A": "1"}, "id": "dev"}
+    assert await adapter.get_bundle("missing") is None
+    assert "id" not in (await adapter.get("bundles/bundles.json"))["bundles"]["dev"]
+
+    assert await adapter.get_active_bundle() == "prod"
+    await adapter.set_active_bundle("dev")
+    assert await adapter.get_active_bundle() == "dev"
+    with pytest.raises(ValueError):
+        await adapter.set_active_bundle("missing")
+
+
+async def test_list_keys_skips_non_json_files(adapter, tmp_path):
+    await adapter.set("data/a.json", {})
+    await adapter.set("data/nested/b.json", {})
+    (tmp_path / "data" / "a.json.tmp").write_text("{}")
+
+    assert sorted(await adapter.list_keys("data")) == [
+        "data/a.json",
+        "data/nested/b.json",
+    ]
+    assert await adapter.list_keys("data/a.json") == ["data/a.json"]
+    assert await adapter.list_keys("missing") == []
+    assert await adapter.list_keys("data/a.json/nope") == []
+
+
+async def test_cache_evicts_least_recently_used(tmp_path):
+    adapter = JsonFileDbAdapter(str(tmp_path), max_cache_entries=2)
+    try:
+        await adapter.set("a.json", {})
+        await adapter.set("b.json", {})
+        await adapter.get("a.json")
+        await adapter.set("c.json", {})
+        assert list(adapter._cache) == ["a.json", "c.json"]
+    finally:
+        adapter.close()
+
+
+async def test_get_reloads_entry_invalidated_during_revalidation(adapter, monkeypatch):
+    await adapter.set("item.json", {"a": 1})
+    adapter._cache_ttl = 0
+    run_io = adapter._run_io
+
+    async def invalidating_run_io(function, *args):
+        adapter.invalidate_cache()
+        return await run_io(function, *args)
+
+    monkeypatch.setattr(adapter, "_run_io", invalidating_run_io)
+    assert await adapter.get("item.json") == {"a": 1}
+
+
+async def test_concurrent_sets_are_written_in_one_batch(adapter, monkeypatch):
+    hops = 0
+    run_io = adapter._run_io
+
+    async def counting_run_io(function, *args):
+        nonlocal hops
+        hops += 1
+        return await run_io(function, *args)
+
+    monkeypatch.setattr(adapter, "_run_io", counting_run_io)
+    await asyncio.gather(*(adapter.set(f"item_{i}.json", {"i": i}) for i in range(5)))
+    assert hops <= 2  # the first write, then everything queued behind it
+
+    adapter.invalidate_cache()
+    monkeypatch.undo()
+    assert await adapter.get("item_4.json") == {"i": 4}
+
+
+async def test_failed_write_only_fails_its_own_set(adapter):
+    results = await asyncio.gather(
+        adapter.set("good.json", {"a": 1}),
+        adapter.set("bad.json", {"a": object()}),
+        return_exceptions=True,
+    )
+    assert results[0] is None
+    assert isinstance(results[1], StorageError)
+    assert await adapter.get("good.json") == {"a": 1}
+
+
+async def test_missing_files_are_cached_briefly(adapter, tmp_path):
+    assert await adapter.get("item.json") is None
+    (tmp_path / "item.json").write_text('{"a": 1}')
+    assert await adapter.get("item.json") is None
+
+    adapter._negative_ttl = 0
+    assert await adapter.get("item.json") == {"a": 1}
+
+    await adapter.delete("item.json")
+    assert await adapter.get("item.json") is None
+    await adapter.set("item.json", {"a": 2})
+    assert await adapter.get("item.json") == {"a": 2}
+
+
+async def test_get_detects_rewrite_with_same_mtime(adapter, tmp_path):
+    await adapter.set("item.json", {"a": 1})
+    path = tmp_path / "item.json"
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text('{"a": 22}')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    adapter._cache_ttl = 0
+    assert await adapter.get("item.json") == {"a": 22}
+
+
+async def test_bundle_methods_share_a_snapshot(adapter, monkeypatch):
+    await adapter.set("bundles/bundles.json", {"bundles": {"dev": {}}})
+    gets = 0
+    get = adapter.get
+
+    async def counting_get(key):
+        nonlocal gets
+        gets += 1
+        return await get(key)
+
+    monkeypatch.setattr(adapter, "get", counting_get)
+    assert await adapter.list_bundles() == [{"id": "dev"}]
+    assert await adapter.get_bundle("dev") == {"id": "dev"}
+    assert gets == 1
+
+    await adapter.set("bundles/bundles.json", {"bundles": {"prod": {}}})
+    assert await adapter.get_bundle("dev") is None
+    assert gets == 2
+
+
+async def test_failed_write_removes_temp_file(adapter, tmp_path, monkeypatch):
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(StorageError):
+        await adapter.set("item.json", {"a": 1})
+    assert list(tmp_path.glob("item.json*")) == []
+
+
+async def test_set_recreates_removed_directory(adapter, tmp_path):
+    await adapter.set("data/a.json", {"a": 1})
+    (tmp_path / "data" / "a.json").unlink()
+    (tmp_path / "data").rmdir()
+
+    await adapter.set("data/a.json", {"a": 2})
+    adapter.invalidate_cache()
+    assert await adapter.get("data/a.json") == {"a": 2}
+
+
+async def test_set_stringifies_non_string_keys(adapter):
+    await adapter.set("item.json", {1: "a", None: "b"})
+    adapter.invalidate_cache()
+    assert await adapter.get("item.json") == {"1": "a", "null": "b"}
+
+
+async def test_set_skips_write_of_unchanged_value(adapter, tmp_path, monkeypatch):
+    await adapter.set("item.json", {"a": 1})
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(
+        os, "replace", lambda *args: replaced.append(args) or real_replace(*args)
+    )
+
+    await adapter.set("item.json", {"a": 1})
+    assert replaced == []
+
+    (tmp_path / "item.json").write_text('{"a": 2, "b": 3}')
+    await adapter.set("item.json", {"a": 1})
+    assert len(replaced) == 1
+    assert json.loads((tmp_path / "item.json").read_text()) == {"a": 1}
+
+
+async def test_unchanged_file_is_revalidated_without_rereading(adapter, monkeypatch):
+    await adapter.set("item.json", {"a": 1})
+    data = await adapter.get("item.json")
+    load_time = adapter._cache["item.json"].load_time
+    adapter._cache_ttl = 0
+    monkeypatch.setattr("core.db.file_db._json_loads", pytest.fail)
+
+    assert await adapter.get("item.json") is data
+    assert adapter._cache["item.json"].load_time > load_time
+
+
+async def test_invalidate_cache_detaches_inflight_loads(adapter, tmp_path, monkeypatch):
+    await adapter.set("item.json", {"a": 1})
+    adapter.invalidate_cache()
+    run_io = adapter._run_io
+    read_done, release = asyncio.Event(), asyncio.Event()
+
+    async def gated_run_io(function, *args):
+        result = await run_io(function, *args)
+        if not release.is_set():
+            read_done.set()
+            await release.wait()
+        return result
+
+    monkeypatch.setattr(adapter, "_run_io", gated_run_io)
+    stale = asyncio.ensure_future(adapter.get("item.json"))
+    await read_done.wait()
+
+    (tmp_path / "item.json").write_text('{"a": 2}')
+    adapter.invalidate_cache("item.json")
+    fresh = asyncio.ensure_future(adapter.get("item.json"))
+    release.set()
+
+    assert await stale == {"a": 1}
+    assert await fresh == {"a": 2}
+    assert adapter._inflight == {}
+
+
+async def test_file_locks_are_released_after_use(adapter):
+    await asyncio.gather(*(adapter.set(f"item_{i}.json", {}) for i in range(10)))
+    await adapter.get("item_0.json")
+    assert len(adapter._file_locks) == 0
+
+
+async def test_large_files_do_not_cache_raw_bytes(adapter, monkeypatch):
+    monkeypatch.setattr("core.db.file_db._MAX_CACHED_RAW_SIZE", 8)
+    await adapter.set("item.json", {"a": "long enough"})
+    assert adapter._cache["item.json"].raw is None
+    assert json.loads(await adapter.get_bytes("item.json")) == {"a": "long enough"}
+
+
+async def test_large_files_are_decoded_from_a_memory_map(adapter, monkeypatch):
+    monkeypatch.setattr("core.db.file_db._MAX_CACHED_RAW_SIZE", 8)
+    await adapter.set("item.json", {"a": "long enough"})
+    adapter.invalidate_cache()
+    assert await adapter.get("item.json") == {"a": "long enough"}
+
+
+async def test_pretty_adapter_writes_indented_json(tmp_path):
+    adapter = JsonFileDbAdapter(str(tmp_path), pretty=True)
+    try:
+        await adapter.set("item.json", {"a": 1})
+        assert (tmp_path / "item.json").read_text() == '{\n  "a": 1\n}'
+    finally:
+        adapter.close()
+
+
+async def test_list_keys_skips_directories_removed_during_walk(adapter, monkeypatch):
+    await adapter.set("data/a.json", {})
+    await adapter.set("data/gone/b.json", {})
+    scandir = os.scandir
+
+    def racing_scandir(path):
+        if str(path).endswith("gone"):
+            raise FileNotFoundError(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", racing_scandir)
+    assert await adapter.list_keys("data") == ["data/a.json"]
@@ -0,0 +1,215 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.db.manager import QiDbManager
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def file_adapter():
+    """A file adapter whose get_settings blocks until released."""
+    adapter = MagicMock()
+    adapter.release = asyncio.Event()
+
+    async def get_settings(scope):
+        await adapter.release.wait()
+        return {"scope": scope}
+
+    adapter.get_settings = MagicMock(side_effect=get_settings)
+    return adapter
+
+
+async def test_concurrent_get_settings_share_one_read(file_adapter):
+    manager = QiDbManager()
+    manager.set_file_adapter(file_adapter)
+
+    tasks = [asyncio.create_task(manager.get_settings("bundle")) for _ in range(5)]
+    tasks.append(asyncio.create_task(manager.get_settings("user")))
+    await asyncio.sleep(0)
+    file_adapter.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results[:5] == [{"scope": "bundle"}] * 5
+    assert results[5] == {"scope": "user"}
+    assert file_adapter.get_settings.call_count == 2
+
+    # Once settled, the next read goes to the adapter again
+    await manager.get_settings("bundle")
+    assert file_adapter.get_settings.call_count == 3
+
+
+async def test_cancelled_reader_does_not_cancel_shared_read(file_adapter):
+    manager = QiDbManager()
+    manager.set_file_adapter(file_adapter)
+
+    first = asyncio.create_task(manager.get_settings("bundle"))
+    second = asyncio.create_task(manager.get_settings("bundle"))
+    await asyncio.sleep(0)
+    first.cancel()
+    file_adapter.release.set()
+
+    assert await second == {"scope": "bundle"}
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_get_all_settings_reads_scopes_concurrently(file_adapter):
+    manager = QiDbManager()
+    manager.set_file_adapter(file_adapter)
+
+    task = asyncio.create_task(manager.get_all_settings())
+    for _ in range(3):
+        await asyncio.sleep(0)
+    # All three reads are in flight before any of them completes
+    assert file_adapter.get_settings.call_count == 3
+    file_adapter.release.set()
+
+    assert await task == {
+        "bundle": {"scope": "bundle"},
+        "project": {"scope": "project"},
+        "user": {"scope": "user"},
+    }
+
+
+async def test_queued_settings_save_is_visible_and_written(file_adapter):
+    manager = QiDbManager()
+    manager.set_file_adapter(file_adapter)
+    written = []
+
+    async def save_settings(scope, settings):
+        written.append((scope, settings))
+
+    file_adapter.save_settings = save_settings
+
+    settings = {"dev": {"a": 1}}
+    manager.queue_settings_save("bundle", settings)
+    settings["dev"]["a"] = 2  # later mutations don't leak into the queued save
+    manager.queue_settings_save("bundle", {"dev": {"a": 3}})
+
+    assert await manager.get_settings("bundle") == {"dev": {"a": 3}}
+    file_adapter.get_settings.assert_not_called()
+
+    await manager.flush_settings()
+    assert written == [("bundle", {"dev": {"a": 3}})]
+    assert manager._queued_settings == {}
+
+
+async def test_burst_of_queued_settings_saves_is_written_once(file_adapter):
+    manager = QiDbManager()
+    manager.set_file_adapter(file_adapter)
+    written = []
+
+    async def save_settings(scope, settings):
+        written.append((scope, settings))
+
+    file_adapter.save_settings = save_settings
+
+    for value in range(3):
+        manager.queue_settings_save("bundle", {"dev": {"a": value}})
+        await asyncio.sleep(0)
+
+    await manager.flush_settings()
+    assert written == [("bundle", {"dev": {"a": 2}})]
+
+
+async def test_direct_save_supersedes_queued_save(file_adapter):
+    manager = QiDbManager()
+    manager.set_file_adapter(file_adapter)
+    written = []
+
+    async def save_settings(scope, settings):
+        written.append((scope, settings))
+
+    file_adapter.save_settings = save_settings
+
+    manager.queue_settings_save("bundle", {"dev": {"a": 1}})
+    await manager.save_settings("bundle", {"dev": {"a": 2}})
+    assert "bundle" not in manager._queued_settings
+
+    await manager.flush_settings()
+    assert written == [("bundle", {"dev": {"a": 2}})]
+
+
+async def test_failed_queued_save_is_kept_and_reported(file_adapter, monkeypatch):
+    monkeypatch.setattr("core.db.manager._MAX_SETTINGS_SAVE_ATTEMPTS", 2)
+    monkeypatch.setattr("core.db.manager.qi_launch_config.settings_save_delay", 0)
+    manager = QiDbManager()
+    manager.set_file_adapter(file_adapter)
+    attempts = []
+
+    async def save_settings(scope, settings):
+        attempts.append(scope)
+        raise OSError("disk full")
+
+    file_adapter.save_settings = save_settings
+
+    manager.queue_settings_save("bundle", {"dev": {"a": 1}})
+    with pytest.raises(OSError):
+        await manager.flush_settings()
+    # Two background attempts, then one more from flush_settings
+    assert attempts == ["bundle"] * 3
+    assert await manager.get_settings("bundle") == {"dev": {"a": 1}}
+
+    written = []
+
+    async def save_settings_ok(scope, settings):
+        written.append((scope, settings))
+
+    file_adapter.save_settings = save_settings_ok
+    await manager.flush_settings()
+    assert written == [("bundle", {"dev": {"a": 1}})]
+    assert manager._queued_settings == {}
+
+
+async def test_flush_settings_threadsafe_writes_on_the_queueing_loop(file_adapter):
+    manager = QiDbManager()
+    manager.set_file_adapter(file_adapter)
+    written = []
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+
+    async def save_settings(scope, settings):
+        written.append(asyncio.get_running_loop())
+
+    file_adapter.save_settings = save_settings
+
+    async def queue():
+        manager.queue_settings_save("bundle", {"dev": {"a": 1}})
+
+    try:
+        asyncio.run_coroutine_threadsafe(queue(), loop).result()
+        await asyncio.to_thread(manager.flush_settings_threadsafe, 5)
+        assert written == [loop]
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def test_direct_save_during_save_delay_is_not_overwritten(
+    file_adapter, monkeypatch
+):
+    monkeypatch.setattr("core.db.manager.qi_launch_config.settings_save_delay", 0.05)
+    manager = QiDbManager()
+    manager.set_file_adapter(file_adapter)
+    file_adapter.release.set()
+    written = []
+
+    async def save_settings(scope, settings):
+        written.append((scope, settings))
+
+    file_adapter.save_settings = save_settings
+
+    manager.queue_settings_save("bundle", {"dev": {"a": 1}})
+    await asyncio.sleep(0)  # the writer is now waiting out the delay
+    await manager.save_settings("bundle", {"dev": {"a": 2}})
+
+    # Reads go to the adapter again instead of the stale queued snapshot
+    assert await manager.get_settings("bundle") == {"scope": "bundle"}
+    await manager.flush_settings()
+    assert written == [("bundle", {"dev": {"a": 2}})]
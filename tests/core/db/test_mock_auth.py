@@ -0,0 +1,42 @@
+import pytest
+
+from core.db.adapters import AuthenticationError
+from core.db.mock_auth import MockAuthAdapter
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_login_and_validate_token():
+    auth = MockAuthAdapter()
+    result = await auth.login("artist", "artist")
+    validated = await auth.validate_token(result["token"])
+    assert validated["user"] == result["user"]
+    with pytest.raises(AuthenticationError):
+        await auth.login("artist", "wrong")
+
+
+async def test_expired_tokens_are_rejected_and_dropped():
+    auth = MockAuthAdapter(token_ttl=0)
+    token = (await auth.login("admin", "admin"))["token"]
+    with pytest.raises(AuthenticationError):
+        await auth.validate_token(token)
+    assert not auth._active_tokens
+
+
+async def test_oldest_tokens_are_dropped_over_the_cap():
+    auth = MockAuthAdapter(max_tokens=2)
+    tokens = [
+        (await auth.login(name, name))["token"] for name in ("admin", "artist", "guest")
+    ]
+    with pytest.raises(AuthenticationError):
+        await auth.validate_token(tokens[0])
+    for token in tokens[1:]:
+        await auth.validate_token(token)
+
+
+async def test_each_login_gets_a_new_token():
+    auth = MockAuthAdapter()
+    first = (await auth.login("guest", "guest"))["token"]
+    second = (await auth.login("guest", "guest"))["token"]
+    assert first != second
+    assert "guest" not in first
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from core.lib.utils import (  # Import _cpu_executor for potential cleanup
+    QiTTLCache,
     _cpu_executor,
     cpu_bound,
 )
@@ -144,3 +145,40 @@ async def test_cpu_bound_uses_run_in_executor(mock_get_loop):
     # assert isinstance(args[1], partial)
     # assert args[1].func == sync_task_add
     # assert args[1].args == (1,2)
+
+
+# --- QiTTLCache ---
+
+
+@patch("core.lib.utils.time.monotonic")
+async def test_ttl_cache_expires_entries(mock_monotonic):
+    mock_monotonic.return_value = 100.0
+    cache = QiTTLCache(ttl=2.0)
+    cache.set("key", [1, 2])
+    assert cache.get("key") == [1, 2]
+
+    mock_monotonic.return_value = 102.0
+    assert cache.get("key") is None
+
+
+async def test_ttl_cache_evicts_least_recently_used():
+    cache = QiTTLCache(ttl=60.0, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+async def test_ttl_cache_invalidate():
+    cache = QiTTLCache(ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    cache.invalidate()
+    assert cache.get("b") is None
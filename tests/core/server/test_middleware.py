@@ -6,7 +6,20 @@ import pytest
 from fastapi import Request
 from starlette.responses import FileResponse, RedirectResponse
 
-from core.server.middleware import QiDevProxyMiddleware, QiSPAStaticFilesMiddleware
+from core.server.middleware import (
+    QiDevProxyMiddleware,
+    QiSPAStaticFilesMiddleware,
+    _get_addon_ui_dir,
+    _resolve_addon_ui_dir,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_addon_ui_dir_cache():
+    """Fixture to drop cached addon UI directories between tests."""
+    _resolve_addon_ui_dir.cache_clear()
+    yield
+    _resolve_addon_ui_dir.cache_clear()
 
 
 @pytest.fixture
@@ -65,6 +78,33 @@ class TestQiDevProxyMiddleware:
             mock_call_next.assert_called_once_with(mock_request)
             assert response == mock_call_next.return_value
 
+    @pytest.mark.asyncio
+    async def test_dispatch_matches_whole_first_segment(
+        self, mock_request, mock_call_next
+    ):
+        """Test an addon name only matches a whole first path segment."""
+        addon_config = {"test": {"url": "http://localhost:3000"}}
+        mock_request.url.path = "/testing/page"
+
+        with patch.dict(os.environ, {"QI_ADDONS": json.dumps(addon_config)}):
+            middleware = QiDevProxyMiddleware(None)
+            response = await middleware.dispatch(mock_request, mock_call_next)
+            assert response == mock_call_next.return_value
+
+    @pytest.mark.asyncio
+    async def test_dev_servers_are_read_once(self, mock_request, mock_call_next):
+        """Test the dev server mapping is read when the middleware is created."""
+        addon_config = {"test": {"url": "http://localhost:3000/"}}
+        mock_request.url.path = "/test/page"
+
+        with patch.dict(os.environ, {"QI_ADDONS": json.dumps(addon_config)}):
+            middleware = QiDevProxyMiddleware(None)
+
+        with patch("core.server.middleware.json.loads") as loads:
+            response = await middleware.dispatch(mock_request, mock_call_next)
+            loads.assert_not_called()
+        assert response.headers["location"] == "http://localhost:3000/test/page"
+
 
 class TestQiSPAStaticFilesMiddleware:
     """Test suite for QiSPAStaticFilesMiddleware."""
@@ -78,6 +118,15 @@ class TestQiSPAStaticFilesMiddleware:
         (ui_dir / "main.js").write_text("console.log('test');")
         return ui_dir
 
+    def test_addon_ui_dir_built_later_is_found(self, tmp_path, monkeypatch):
+        """Test a missing UI directory is looked up again on later requests."""
+        monkeypatch.chdir(tmp_path)
+        assert _get_addon_ui_dir("late") is None
+
+        ui_dir = tmp_path / "addons" / "late" / "ui-dist"
+        ui_dir.mkdir(parents=True)
+        assert _get_addon_ui_dir("late") == ui_dir.resolve()
+
     @pytest.mark.asyncio
     async def test_dispatch_skip_non_addon_paths(self, mock_request, mock_call_next):
         """Test dispatch skips non-addon paths."""
@@ -13,7 +13,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from starlette.responses import RedirectResponse, Response
 
-from core.server.middleware import QiDevProxyMiddleware, QiSPAStaticFilesMiddleware
+from core.server.middleware import (
+    QiDevProxyMiddleware,
+    QiSPAStaticFilesMiddleware,
+    _resolve_addon_ui_dir,
+)
 
 
 class MockRequest:
@@ -25,6 +29,14 @@ class MockRequest:
         self.query_params = query_params
 
 
+@pytest.fixture(autouse=True)
+def clear_addon_ui_dir_cache():
+    """Fixture to drop cached addon UI directories between tests."""
+    _resolve_addon_ui_dir.cache_clear()
+    yield
+    _resolve_addon_ui_dir.cache_clear()
+
+
 @pytest.fixture
 def mock_call_next():
     """Create a mock call_next function that returns a default response."""
@@ -572,3 +572,58 @@ def test_edge_cases_and_error_conditions():
     inherited = original_group.inherit(defaults=False)
     assert inherited is not original_group
     assert inherited.modifiable is True
+
+
+def test_model_schema_is_cached_until_rebuild(monkeypatch):
+    root = QiSettings()
+    with root as r:
+        r.foo = QiProp(1, title="Foo")
+
+    calls = 0
+    original = root._model_cls.model_json_schema
+
+    def counting_schema(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(root._model_cls, "model_json_schema", counting_schema)
+
+    first = root.get_model_schema()
+    second = root.get_model_schema()
+    assert calls == 1
+    assert first == second
+
+    # Callers get independent copies
+    first["properties"]["foo"]["title"] = "Changed"
+    assert root.get_model_schema()["properties"]["foo"]["title"] == "Foo"
+
+    # Rebuilding drops the cached schema
+    root.set_defaults({"foo": 2})
+    assert root.get_model_schema()["properties"]["foo"]["default"] == 2
+
+
+def test_get_value_at_matches_get_values():
+    root = QiSettings()
+    with root as r:
+        r.general = QiGroup()
+        with r.general as g:
+            g.name = "qi"
+            g.tags = ["a", "b"]
+        r.entries = QiGroup(modifiable=True, default_key="first")
+        with r.entries as e:
+            e.enabled = True
+
+    values = root.get_values()
+    assert root.get_value_at(["general"]) == values["general"]
+    assert root.get_value_at(["general", "tags"]) == ["a", "b"]
+    assert root.get_value_at(["entries"]) == values["entries"]
+    assert root.get_value_at(["entries", "first", "enabled"]) is True
+
+    # Returned containers are copies, not the live model data
+    root.get_value_at(["general", "tags"]).append("c")
+    assert root.get_value_at(["general", "tags"]) == ["a", "b"]
+
+    for missing in (["nope"], ["general", "nope"], ["general", "name", "x"]):
+        with pytest.raises(KeyError):
+            root.get_value_at(missing)
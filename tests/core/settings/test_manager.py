@@ -0,0 +1,85 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.settings.base import QiGroup
+from core.settings.manager import QiSettingsManager, _set_nested_value
+
+
+def test_set_nested_value_creates_missing_levels():
+    data = {}
+    _set_nested_value(data, "addons.my_addon.threshold", 0.5)
+    assert data == {"addons": {"my_addon": {"threshold": 0.5}}}
+
+
+def test_set_nested_value_preserves_siblings():
+    data = {"addons": {"my_addon": {"mode": "auto"}, "other": {"x": 1}}}
+    _set_nested_value(data, "addons.my_addon.threshold", 0.5)
+    assert data["addons"]["my_addon"] == {"mode": "auto", "threshold": 0.5}
+    assert data["addons"]["other"] == {"x": 1}
+
+
+@pytest.mark.parametrize(
+    "data, path, expected",
+    [
+        ({"a": 1}, "a.b", {"a": {"b": "v"}}),
+        ({"a": {"b": "x"}}, "a.b.c", {"a": {"b": {"c": "v"}}}),
+    ],
+)
+def test_set_nested_value_overwrites_non_dict_parts(data, path, expected):
+    _set_nested_value(data, path, "v")
+    assert data == expected
+
+
+def test_set_nested_value_rejects_empty_path():
+    with pytest.raises(ValueError):
+        _set_nested_value({}, "", 1)
+
+
+def test_get_value_walks_built_settings():
+    manager = QiSettingsManager()
+    with manager._root_settings as r:
+        r.core = QiGroup()
+        with r.core as core:
+            core.threshold = 0.5
+    manager._is_built = True
+
+    assert manager.get_value("core.threshold") == 0.5
+    assert manager.get_value("core") == {"threshold": 0.5}
+    assert manager.get_value("core.missing", "fallback") == "fallback"
+    assert manager.get_value("core.threshold.deeper", None) is None
+
+
+def test_get_value_before_build_returns_default():
+    manager = QiSettingsManager()
+    assert manager.get_value("core.threshold", 1) == 1
+
+
+async def test_patch_value_does_not_modify_loaded_settings():
+    stored = {"main": {"core": {"threshold": 0.5}}, "other": {"x": 1}}
+    manager = QiSettingsManager()
+    manager._is_built = True
+    manager._bundle_manager = MagicMock()
+    manager._bundle_manager.get_active_bundle.return_value.name = "main"
+    manager._db_manager = MagicMock()
+    manager._db_manager.get_settings = AsyncMock(return_value=stored)
+    manager._db_manager.save_settings = AsyncMock()
+    manager.build_settings = AsyncMock()
+
+    await manager.patch_value("bundle", "core.threshold", 0.9, sync=True)
+
+    saved = manager._db_manager.save_settings.call_args.args[1]
+    assert saved == {"main": {"core": {"threshold": 0.9}}, "other": {"x": 1}}
+    assert stored == {"main": {"core": {"threshold": 0.5}}, "other": {"x": 1}}
+
+
+async def test_build_settings_completes():
+    manager = QiSettingsManager()
+    manager._addon_manager = MagicMock()
+    manager._addon_manager.get_all_addons.return_value = []
+    manager._bundle_manager = MagicMock()
+    manager._db_manager = MagicMock()
+    manager._db_manager.get_settings = AsyncMock(return_value={})
+
+    await manager.build_settings()
+    assert manager._is_built
@@ -8,12 +8,26 @@ import pytest
 from pydantic_settings import SettingsError
 
 # Import the parts of config.py we want to test
-from core.config import CONFIG_FILE, DOTENV_FILE, QiLaunchConfig
+from core.config import (
+    CONFIG_FILE,
+    DOTENV_FILE,
+    QiLaunchConfig,
+    _load_toml_config,
+    _resolve_existing_path,
+)
 from core.constants import BASE_PATH as CONST_BASE_PATH  # For comparison
 
 # Mark tests as synchronous if no async operations
 
 
+@pytest.fixture(autouse=True)
+def clear_toml_cache():
+    """Fixture to make every test re-read the (possibly mocked) TOML file."""
+    _load_toml_config.cache_clear()
+    yield
+    _load_toml_config.cache_clear()
+
+
 @pytest.fixture
 def mock_env_vars(monkeypatch):
     """Fixture to set and unset environment variables for testing."""
@@ -229,6 +243,20 @@ def test_qiconfigmanager_source_priority(mock_toml_load, mock_env_vars):
         assert config_env_dev.log_level == "DEBUG"
 
 
+@patch("core.config.tomllib.load", return_value={"qi": {"host": "toml_host"}})
+def test_toml_file_is_read_once(mock_toml_load, mock_env_vars, mock_config_files):
+    """Tests that the TOML file is parsed once and reused by later builds."""
+    mock_exists, _ = mock_config_files
+    mock_exists.return_value = True
+
+    first = QiLaunchConfig()
+    second = QiLaunchConfig(port=9999)
+
+    mock_toml_load.assert_called_once()
+    assert first.host == second.host == "toml_host"
+    assert second.port == 9999
+
+
 # --- Test Field Validators and Model Validators --- #
 
 
@@ -288,6 +316,46 @@ def test_addon_paths_validator(mock_env_vars, mock_config_files):
         assert config_empty_list.addon_paths == []
 
 
+def test_addon_paths_resolution_is_memoized(mock_env_vars, mock_config_files, tmp_path):
+    """Tests that existing addon paths are resolved only once per process."""
+    from core.config import _resolve_strict_path
+
+    mock_exists, _ = mock_config_files
+    mock_exists.return_value = False
+    path1 = tmp_path / "path1"
+    path2 = tmp_path / "path2"
+    path1.mkdir()
+    path2.mkdir()
+    addon_paths = [path1.as_posix(), path2.as_posix()]
+
+    with patch("core.config.tomllib.load", return_value={}):
+        QiLaunchConfig(addon_paths=addon_paths)
+        hits_before = _resolve_strict_path.cache_info().hits
+        config = QiLaunchConfig(addon_paths=addon_paths)
+
+    assert _resolve_strict_path.cache_info().hits == hits_before + 2
+    assert config.addon_paths == [
+        path1.resolve().as_posix(),
+        path2.resolve().as_posix(),
+    ]
+
+
+def test_addon_paths_resolution_rechecks_missing_paths(tmp_path, monkeypatch):
+    """Tests that missing or relative addon paths are not cached."""
+    from core.config import _resolve_path
+
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    (second / "addons").mkdir(parents=True)
+    first.mkdir()
+
+    monkeypatch.chdir(first)
+    assert _resolve_path("addons") == (first / "addons").resolve().as_posix()
+
+    monkeypatch.chdir(second)
+    assert _resolve_path("addons") == (second / "addons").resolve().as_posix()
+
+
 def test_log_level_validator(mock_env_vars, mock_config_files):
     """Tests that the log level is correctly uppercased."""
     mock_exists, _ = mock_config_files
@@ -345,6 +413,23 @@ def test_invalid_toml_file_raises_settings_error(mock_env_vars, mock_config_file
         QiLaunchConfig()
 
 
+def test_resolve_existing_path_rechecks_missing_paths(tmp_path):
+    target = tmp_path / "target"
+    link = tmp_path / "link"
+
+    # Missing paths fall back to the unresolved absolute path
+    assert _resolve_existing_path(link.as_posix()) == link.as_posix()
+
+    target.mkdir()
+    try:
+        link.symlink_to(target)
+    except OSError:
+        pytest.skip("Symlinks are not supported here")
+
+    # Once the path exists it is resolved instead of reusing the fallback
+    assert _resolve_existing_path(link.as_posix()) == target.resolve().as_posix()
+
+
 # This test is problematic because the module-level singleton `qi_launch_config`
 # is instantiated upon module import. Re-testing its creation is difficult
 # without complex test setups like `importlib.reload`.
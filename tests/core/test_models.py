@@ -1,3 +1,4 @@
+import sys
 import time
 from uuid import UUID, uuid4
 
@@ -6,6 +7,8 @@ from pydantic import ConfigDict, ValidationError
 
 from core.models import (
     QiBaseModel,
+    QiBundle,
+    QiBundleCollection,
     QiContext,
     QiMessage,
     QiMessageType,
@@ -238,3 +241,32 @@ def test_qimessage_type_enum():
             type: QiMessageType
 
         MsgWithInvalidType(type="invalid_type")
+
+
+# --- Test QiBundle ---
+
+
+def test_qibundle_is_frozen():
+    bundle = QiBundle(name="dev", allow_list=["core"], env={"QI_ENV": "dev"})
+    with pytest.raises(ValidationError):
+        bundle.name = "prod"
+    # Frozen models keep the inherited QiBaseModel configuration
+    assert QiBundle.model_config["defer_build"] is True
+
+
+def test_qibundlecollection_is_frozen():
+    collection = QiBundleCollection.model_validate(
+        {"bundles": {"dev": {"name": "dev"}}}
+    )
+    assert collection.bundles["dev"].name == "dev"
+    with pytest.raises(ValidationError):
+        collection.bundles = {}
+
+
+def test_qibundle_env_is_interned():
+    key = "".join(["QI_", "ENV"])
+    value = "".join(["deve", "lopment"])
+    bundle = QiBundle(name="dev", env={key: value})
+    ((env_key, env_value),) = bundle.env.items()
+    assert env_key is sys.intern("QI_ENV")
+    assert env_value is sys.intern("development")